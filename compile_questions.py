@@ -0,0 +1,60 @@
+"""
+================================================================================
+                 ROBOT RACE QUIZ - COMPILADOR DE PREGUNTAS
+================================================================================
+
+DESCRIPCION:
+    Lee el Excel de preguntas una sola vez y las guarda en questions_data.py
+    como una tupla de Python. El juego carga ese modulo al arrancar y asi no
+    necesita importar pandas ni leer el Excel en cada inicio.
+
+    El Excel se lee con read_question_rows() de questions_source.py, la misma
+    funcion que usa el juego, de modo que questions_data.py coincide siempre
+    con la lectura directa del Excel.
+
+    questions_data.py guarda tambien la huella (SHA-1) del Excel con el que se
+    genero: si el Excel cambia, el juego lo detecta y vuelve a leer el Excel
+    hasta que se ejecute de nuevo este script.
+
+USO:
+    python compile_questions.py [archivo.xlsx]
+
+REQUISITOS:
+    pip install pandas openpyxl
+================================================================================
+"""
+
+import logging
+import os
+import sys
+
+from questions_source import QUESTIONS_EXCEL_FILE, file_sha1, log, read_question_rows
+
+OUTPUT_FILE = "questions_data.py"
+
+
+def main() -> None:
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    excel_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(base_path, QUESTIONS_EXCEL_FILE)
+    output_path = os.path.join(base_path, OUTPUT_FILE)
+
+    # Los mensajes [OK]/[WARNING] de la lectura se muestran siempre aqui
+    logging.basicConfig(format="%(message)s")
+    log.setLevel(logging.INFO)
+
+    questions = read_question_rows(excel_path)
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(f'"""\nPreguntas compiladas desde {os.path.basename(excel_path)}.\n'
+                f'Archivo generado por compile_questions.py: no editar a mano.\n"""\n\n')
+        f.write(f"SOURCE_SHA1 = {file_sha1(excel_path)!r}\n\n")
+        f.write("QUESTIONS = (\n")
+        for question in questions:
+            f.write(f"    {question!r},\n")
+        f.write(")\n")
+
+    log.info("[OK] %s preguntas escritas en %s", len(questions), output_path)
+
+
+if __name__ == "__main__":
+    main()
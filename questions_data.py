@@ -0,0 +1,159 @@
+"""
+Preguntas compiladas desde preguntasCompletasVirgilio.xlsx.
+Archivo generado por compile_questions.py: no editar a mano.
+"""
+
+SOURCE_SHA1 = 'ed0509926eaadf9046f6fdfd9daa95ab68e0ce1b'
+
+QUESTIONS = (
+    (1, '¿Cuál de estos números es par?', '18', '15', '21'),
+    (1, '¿Qué figura tiene tres lados?', 'Triángulo', 'Cuadrado', 'Círculo'),
+    (1, '¿Cuál número es mayor?', '54', '45', '44'),
+    (1, '¿Qué figura es redonda?', 'Círculo', 'Triángulo', 'Cuadrado'),
+    (1, '¿Qué número es impar?', '19', '20', '18'),
+    (1, '¿Cuántos lados tiene un cuadrado?', '4', '3', '5'),
+    (1, '¿Qué figura tiene cuatro lados iguales?', 'Cuadrado', 'Rectángulo', 'Pentágono'),
+    (1, '¿Cuál número es menor?', '23', '32', '29'),
+    (1, '¿Qué figura tiene forma de pelota?', 'Esfera', 'Cubo', 'Pirámide'),
+    (1, '¿Qué número está antes del 50?', '49', '48', '51'),
+    (1, '¿Qué unidad se usa para medir el tiempo?', 'Hora', 'Metro', 'Kilo'),
+    (1, '¿Qué figura tiene cinco lados?', 'Pentágono', 'Cuadrado', 'Hexágono'),
+    (1, '¿Cuál número tiene dos cifras?', '25', '9', '7'),
+    (1, '¿Qué figura NO tiene lados?', 'Círculo', 'Triángulo', 'Cuadrado'),
+    (1, '¿Cuál objeto se parece a un cilindro?', 'Lata', 'Caja', 'Pirámide'),
+    (1, '¿Qué número es mayor?', '76', '67', '66'),
+    (1, '¿Qué figura tiene seis lados?', 'Hexágono', 'Pentágono', 'Octágono'),
+    (1, '¿Qué viene después? 10,20,30', '40', '25', '35'),
+    (1, '¿Qué unidad se usa para medir longitud?', 'Metro', 'Litro', 'Hora'),
+    (1, '¿Qué figura es una caja?', 'Cubo', 'Esfera', 'Cilindro'),
+    (1, '¿Cuál número es impar?', '27', '24', '30'),
+    (1, '¿Qué forma tiene una moneda?', 'Círculo', 'Cuadrado', 'Rectángulo'),
+    (1, '¿Qué figura tiene vértices?', 'Cuadrado', 'Círculo', 'Esfera'),
+    (1, '¿Qué número está entre 40 y 50?', '45', '39', '51'),
+    (1, '¿Qué unidad se usa para medir peso?', 'Kilogramo', 'Metro', 'Segundo'),
+    (1, '¿Qué figura tiene ocho lados?', 'Octágono', 'Hexágono', 'Pentágono'),
+    (1, '¿Qué número tiene tres cifras?', '125', '99', '45'),
+    (1, '¿Qué objeto se parece a una esfera?', 'Pelota', 'Caja', 'Lata'),
+    (1, '¿Qué figura tiene caras planas?', 'Cubo', 'Esfera', 'Círculo'),
+    (1, '¿Cuál número es menor?', '28', '82', '92'),
+    (1, '¿Qué número sigue? 5,10,15', '20', '18', '25'),
+    (1, '¿Qué unidad se usa para medir capacidad?', 'Litro', 'Metro', 'Kilo'),
+    (1, '¿Qué figura tiene forma de cono?', 'Cono de helado', 'Caja', 'Pelota'),
+    (1, '¿Qué número está después del 99?', '100', '98', '90'),
+    (1, '¿Qué figura tiene lados y vértices?', 'Triángulo', 'Círculo', 'Esfera'),
+    (1, '¿Qué unidad se usa para medir el tiempo?', 'Segundo', 'Metro', 'Kilo'),
+    (1, '¿Qué figura tiene base circular?', 'Cilindro', 'Cubo', 'Pirámide'),
+    (1, '¿Qué número es mayor?', '143', '134', '124'),
+    (1, '¿Qué figura tiene 3 dimensiones?', 'Cubo', 'Cuadrado', 'Triángulo'),
+    (1, '¿Qué objeto se parece a un cubo?', 'Dado', 'Pelota', 'Lata'),
+    (1, '¿Qué número es par?', '56', '55', '57'),
+    (1, '¿Qué figura no tiene vértices?', 'Círculo', 'Cuadrado', 'Triángulo'),
+    (1, '¿Qué número tiene una sola cifra?', '7', '15', '20'),
+    (1, '¿Qué unidad se usa para medir distancia?', 'Metro', 'Litro', 'Gramo'),
+    (1, '¿Qué figura tiene cinco vértices?', 'Pentágono', 'Cuadrado', 'Hexágono'),
+    (1, '¿Qué número es mayor?', '290', '209', '192'),
+    (1, '¿Qué objeto se parece a un cilindro?', 'Lata', 'Pelota', 'Dado'),
+    (1, '¿Qué figura tiene caras curvas?', 'Esfera', 'Cubo', 'Cuadrado'),
+    (1, '¿Qué número está entre 70 y 80?', '75', '69', '81'),
+    (1, '¿Qué figura tiene base triangular?', 'Pirámide', 'Cubo', 'Cilindro'),
+    (2, '¿Cuál de los siguientes números es racional?', '3/4', '√2', 'π'),
+    (2, '¿Qué figura tiene todos sus lados paralelos dos a dos?', 'Rectángulo', 'Trapecio', 'Triángulo'),
+    (2, '¿Cuál número pertenece a los números enteros?', '-5', '2.3', '1/2'),
+    (2, '¿Qué ángulo mide más de 90° y menos de 180°?', 'Obtuso', 'Agudo', 'Recto'),
+    (2, '¿Cuál de los siguientes es un número primo?', '13', '9', '15'),
+    (2, '¿Qué gráfica representa una relación proporcional?', 'Línea recta que pasa por el origen', 'Curva', 'Línea horizontal'),
+    (2, '¿Cuál figura tiene exactamente un par de lados paralelos?', 'Trapecio', 'Rectángulo', 'Rombo'),
+    (2, '¿Qué número NO pertenece a los números naturales?', '-1', '3', '0'),
+    (2, '¿Qué tipo de ángulo mide exactamente 90°?', 'Recto', 'Agudo', 'Obtuso'),
+    (2, '¿Qué número es irracional?', '√7', '0.5', '1/3'),
+    (2, '¿Qué figura tiene todos sus lados iguales pero ángulos distintos?', 'Rombo', 'Cuadrado', 'Rectángulo'),
+    (2, '¿Qué conjunto numérico incluye a los enteros y fracciones?', 'Racionales', 'Naturales', 'Irracionales'),
+    (2, '¿Qué transformación geométrica conserva forma y tamaño?', 'Traslación', 'Ampliación', 'Reducción'),
+    (2, '¿Cuál de estas es una variable?', 'x', '5', '10'),
+    (2, '¿Qué tipo de rectas nunca se cortan?', 'Paralelas', 'Secantes', 'Perpendiculares'),
+    (2, '¿Qué número pertenece a los números reales?', '√3', '√-1', '∞'),
+    (2, '¿Cuál es un polígono regular?', 'Cuadrado', 'Triángulo escaleno', 'Rectángulo'),
+    (2, '¿Qué tipo de ángulo mide menos de 90°?', 'Agudo', 'Recto', 'Obtuso'),
+    (2, '¿Qué representa una ecuación?', 'Igualdad', 'Comparación', 'Suma'),
+    (2, '¿Qué número tiene mayor valor absoluto?', '-12', '-8', '5'),
+    (2, '¿Qué figura tridimensional tiene caras rectangulares?', 'Prisma rectangular', 'Esfera', 'Cono'),
+    (2, '¿Qué número puede escribirse como fracción?', '0.25', 'π', '√2'),
+    (2, '¿Qué sistema se usa para ubicar puntos en un plano?', 'Cartesiano', 'Numérico', 'Geométrico'),
+    (2, '¿Qué tipo de gráfico se usa para porcentajes?', 'Circular', 'Barras', 'Lineal'),
+    (2, '¿Qué indica una razón?', 'Comparación', 'Suma', 'Diferencia'),
+    (2, '¿Qué figura tiene dos bases circulares?', 'Cilindro', 'Cono', 'Esfera'),
+    (2, '¿Qué número NO es racional?', '√5', '0.75', '-2'),
+    (2, '¿Qué tipo de rectas se cruzan formando 90°?', 'Perpendiculares', 'Paralelas', 'Secantes'),
+    (2, '¿Qué término representa una letra en álgebra?', 'Variable', 'Constante', 'Coeficiente'),
+    (2, '¿Qué figura tiene solo una base circular?', 'Cono', 'Cilindro', 'Prisma'),
+    (2, '¿Qué conjunto numérico incluye al cero?', 'Enteros', 'Naturales', 'Irracionales'),
+    (2, '¿Qué ángulo mide exactamente 180°?', 'Llano', 'Recto', 'Completo'),
+    (2, '¿Qué figura es un polígono de 8 lados?', 'Octágono', 'Hexágono', 'Pentágono'),
+    (2, '¿Qué tipo de número es −3?', 'Entero', 'Natural', 'Irracional'),
+    (2, '¿Qué gráfica representa una relación constante?', 'Línea horizontal', 'Curva', 'Línea inclinada'),
+    (2, '¿Qué propiedad indica que el orden no altera el resultado?', 'Conmutativa', 'Asociativa', 'Distributiva'),
+    (2, '¿Qué tipo de número es π?', 'Irracional', 'Racional', 'Entero'),
+    (2, '¿Qué figura tiene todas sus caras triangulares?', 'Pirámide', 'Prisma', 'Cubo'),
+    (2, '¿Qué término acompaña a la variable?', 'Coeficiente', 'Exponente', 'Raíz'),
+    (2, '¿Qué sistema se usa para pares ordenados?', 'Cartesiano', 'Decimal', 'Métrico'),
+    (2, '¿Qué tipo de polígono tiene ángulos iguales?', 'Regular', 'Irregular', 'Escaleno'),
+    (2, '¿Qué número pertenece a los irracionales?', '√11', '1/4', '0.2'),
+    (2, '¿Qué figura tiene base rectangular?', 'Prisma', 'Esfera', 'Cono'),
+    (2, '¿Qué tipo de recta se cruza en un punto?', 'Secante', 'Paralela', 'Horizontal'),
+    (2, '¿Qué representa una gráfica de barras?', 'Comparación de datos', 'Tiempo', 'Ángulos'),
+    (2, '¿Qué número es mayor?', '-1', '-2', '-5'),
+    (2, '¿Qué figura tiene base poligonal y caras triangulares?', 'Pirámide', 'Prisma', 'Cilindro'),
+    (2, '¿Qué tipo de variable toma valores enteros?', 'Discreta', 'Continua', 'Cualitativa'),
+    (2, '¿Qué conjunto numérico contiene a todos?', 'Reales', 'Naturales', 'Racionales'),
+    (2, '¿Qué ángulo mide más de 180°?', 'Cóncavo', 'Obtuso', 'Agudo'),
+    (3, '¿Qué número pertenece a los reales?', '√2', '√-9', '∞'),
+    (3, '¿Qué tipo de función es una recta?', 'Lineal', 'Cuadrática', 'Exponencial'),
+    (3, '¿Qué representa el discriminante?', 'Cantidad de soluciones reales', 'Pendiente', 'Vértice'),
+    (3, '¿Qué conjunto incluye racionales e irracionales?', 'Reales', 'Enteros', 'Naturales'),
+    (3, '¿Qué gráfica representa función constante?', 'Recta horizontal', 'Parábola', 'Recta oblicua'),
+    (3, '¿Qué indica el dominio de una función?', 'Valores permitidos de x', 'Valores de y', 'Pendiente'),
+    (3, '¿Qué ángulo forman rectas perpendiculares?', 'Recto', 'Agudo', 'Obtuso'),
+    (3, '¿Qué tipo de función es una parábola?', 'Cuadrática', 'Lineal', 'Logarítmica'),
+    (3, '¿Qué significa que funciones sean inversas?', 'Una deshace a la otra', 'Misma gráfica', 'Paralelas'),
+    (3, '¿Qué representa el vértice de una parábola?', 'Máximo o mínimo', 'Cruce con eje x', 'Origen'),
+    (3, '¿Qué conjunto numérico contiene al número i?', 'Complejos', 'Reales', 'Racionales'),
+    (3, '¿Qué tipo de rectas tienen la misma pendiente?', 'Paralelas', 'Secantes', 'Perpendiculares'),
+    (3, '¿Qué es una asíntota?', 'Una recta a la que se acerca una gráfica', 'Un eje', 'Un punto de intersección'),
+    (3, '¿Qué representa el rango de una función?', 'Los valores de y', 'Los valores de x', 'La pendiente'),
+    (3, '¿Qué tipo de función modela el crecimiento poblacional ideal?', 'Exponencial', 'Lineal', 'Cuadrática'),
+    (3, '¿Qué tipo de gráfica representa una función logarítmica?', 'Curva creciente', 'Recta', 'Parábola'),
+    (3, '¿Qué condición deben cumplir dos matrices para poder sumarse?', 'Tener el mismo orden', 'Tener el mismo determinante', 'Ser cuadradas'),
+    (3, '¿Qué indica el determinante de una matriz?', 'Si el sistema tiene solución unica', 'El tamaño', 'El numero de filas'),
+    (3, '¿Qué tipo de sistema de ecuaciones tiene infinitas soluciones?', 'Compatible indeterminado', 'Compatible determinado', 'Incopatible'),
+    (3, '¿Qué representa el punto de intersección de dos rectas?', 'La solución del sistema', 'El dominio', 'La pendiente'),
+    (3, '¿Qué tipo de evento tiene probabilidad igual a 1?', 'Seguro', 'Imposible', 'Aleatorio'),
+    (3, '¿Qué representa la media aritmética?', 'El promedio', 'El valor más frecuente', 'El valor central'),
+    (3, '¿Qué mide la desviación estándar?', 'La dispersión de los datos', 'El valor medio', 'El valor máximo'),
+    (3, '¿Qué tipo de gráfica se usa para analizar correlación?', 'Dispersión', 'Circular', 'Barras'),
+    (3, '¿Qué evento no puede ocurrir?', 'Imposible', 'Posible', 'Seguro'),
+    (3, '¿Qué representa el eje x en una función?', 'La variable independiente', 'El rango', 'La imagen'),
+    (3, '¿Qué significa que una función sea biyectiva?', 'Que es inyectiva y suprayectiva', 'Que no tiene dominio', 'Que es constante'),
+    (3, '¿Qué tipo de función no es continua?', 'Racional', 'Exponencial', 'Polinomica'),
+    (3, '¿Qué representa una pendiente positiva?', 'Función creciente', 'Función decreciente', 'Función constante'),
+    (3, '¿Qué tipo de número es e?', 'Irracional', 'Entero', 'Racional'),
+    (3, '¿Qué representa el límite de una función?', 'El valor al que se aproxima', 'El valor exacto', 'El dominio'),
+    (3, '¿Qué indica la continuidad de una función?', 'Que se pueda dibujar sin levantar el lapiz', 'Que tenga asintotas', 'Que sea constante'),
+    (3, '¿Qué tipo de ángulo mide más de 180°?', 'Concavo', 'Obtuso', 'Recto'),
+    (3, '¿Qué propiedad cumple la función identidad?', 'f(x)=x', 'f(x)=1', 'f(X)=0'),
+    (3, '¿Qué indica el vértice en una función cuadrática?', 'Máximo o mínimo', 'El cruce con el eje y', 'La pendiente'),
+    (3, '¿Qué tipo de función modela la depreciación?', 'Exponencial decreciente', 'Lineal', 'Logarítmica'),
+    (3, '¿Qué conjunto numérico contiene a los complejos?', 'Complejos', 'Reales', 'Racionales'),
+    (3, '¿Qué representa la moda en estadística?', 'El promedio', 'El valor más frecuente', 'El valor central'),
+    (3, '¿Qué indica un coeficiente de correlación cercano a 1?', 'Relación positiva fuerte', 'Relacion negativa', 'Relacion débil'),
+    (3, '¿Qué tipo de evento depende del azar?', 'Aleatorio', 'Seguro', 'Imposible'),
+    (3, '¿Qué condición cumple una función inyectiva?', 'Cada y corresponde a un solo x', 'Dos x con el mismo y', 'Tiene asintotas'),
+    (3, '¿Qué representa una matriz identidad?', 'El elemento neutro de la multiplicación', 'Una matriz nula', 'Una matriz regular'),
+    (3, '¿Qué tipo de sistema no tiene solución?', 'Incompatible', 'Compatible determinado', 'Compatible indeterminado'),
+    (3, '¿Qué indica la mediana?', 'El valor central', 'El valor más frecuente', 'El promedio'),
+    (3, '¿Qué tipo de gráfica muestra proporciones?', 'Circular', 'Barras', 'Dispersión'),
+    (3, '¿Qué representa el plano cartesiano?', 'Un sistema de referencia', 'Un ángulo', 'Una recta'),
+    (3, '¿Qué tipo de función tiene asíntotas verticales?', 'Racional', 'Cuadratica', 'Lineal'),
+    (3, '¿Qué representa una probabilidad de 0?', 'Evento imposible', 'Evento posible', 'Evento seguro'),
+    (3, '¿Qué indica un intervalo cerrado?', 'Incluye ambos extremos', 'Incluye solo uno', 'No incluye extremos'),
+    (3, '¿Qué tipo de variable toma valores continuos?', 'Continua', 'Cualitativa', 'Discreta'),
+)
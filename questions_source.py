@@ -0,0 +1,82 @@
+"""
+================================================================================
+                 ROBOT RACE QUIZ - LECTURA DEL EXCEL DE PREGUNTAS
+================================================================================
+
+DESCRIPCION:
+    Lectura del Excel de preguntas compartida por el juego y por
+    compile_questions.py, para que questions_data.py y la lectura directa del
+    Excel interpreten el archivo exactamente igual.
+
+    Este modulo no tiene efectos al importarse: no inicia pygame ni intenta
+    conectar los robots EV3, y pandas solo se importa al leer un Excel.
+
+REQUISITOS:
+    pip install pandas openpyxl
+================================================================================
+"""
+
+import hashlib
+import logging
+from typing import List, Tuple
+
+log = logging.getLogger("robotrace")
+
+QUESTIONS_EXCEL_FILE = "preguntasCompletasVirgilio.xlsx"
+QUESTION_COLUMNS = ('Nivel', 'Pregunta', 'Respuesta Correcta', 'R1', 'R2')
+
+
+def file_sha1(path: str) -> str:
+    """
+    Huella SHA-1 del contenido de un archivo.
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def read_question_rows(path: str) -> List[Tuple[int, str, str, str, str]]:
+    """
+    Lee las preguntas de un Excel como tuplas (nivel, pregunta, correcta,
+    r1, r2), en el orden de los campos de Question. Las filas con un nivel
+    invalido se omiten. Lanza ValueError si faltan columnas.
+    """
+    # pandas se importa solo cuando hay un Excel que leer: es un
+    # import pesado que no hace falta con las preguntas por defecto
+    import pandas as pd
+
+    # Motor calamine (Rust) si esta instalado; si no, openpyxl,
+    # que pandas ya abre en modo read_only
+    try:
+        import python_calamine  # noqa: F401
+        engine = "calamine"
+    except ImportError:
+        engine = "openpyxl"
+
+    # Solo se leen las columnas usadas; el filtro por funcion no
+    # falla si falta alguna, para poder informarlo abajo
+    usecols = lambda col: col in QUESTION_COLUMNS
+    try:
+        df = pd.read_excel(path, engine=engine, usecols=usecols)
+    except (ValueError, ImportError) as e:
+        # pandas < 2.2 no conoce el motor calamine: se reintenta
+        # con openpyxl antes de dar la lectura por fallida
+        if engine == "openpyxl":
+            raise
+        log.warning("[WARNING] Motor calamine no disponible (%s): se usa openpyxl", e)
+        df = pd.read_excel(path, engine="openpyxl", usecols=usecols)
+
+    missing = [col for col in QUESTION_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Columnas faltantes en Excel: {missing} (encontradas: {list(df.columns)})")
+
+    # Columnas de texto convertidas y recortadas de una vez (vectorizado);
+    # el bucle solo recorre columnas ya listas, sin Series por fila
+    texts = [df[col].astype(str).str.strip().tolist() for col in QUESTION_COLUMNS[1:]]
+
+    rows = []
+    for nivel, pregunta, correcta, r1, r2 in zip(df['Nivel'].tolist(), *texts):
+        try:
+            rows.append((int(nivel), pregunta, correcta, r1, r2))
+        except (TypeError, ValueError) as e:
+            log.warning("[WARNING] Error procesando fila: %s", e)
+    return rows
@@ -44,6 +44,10 @@ FLUJO DEL JUEGO:
 
 REQUISITOS:
     pip install pygame pandas openpyxl pybricks
+    (pandas/openpyxl no hacen falta si questions_data.py esta al dia:
+     python compile_questions.py)
+    Opcional, para un bucle de juego mas rapido con el JIT de PyPy:
+        pypy3 -m pip install pygame-ce && pypy3 robot_race_quiz_v5.py
 
 CONFIGURACION BLUETOOTH:
     1. Emparejar ambos EV3 con la computadora via Bluetooth
@@ -75,23 +79,39 @@ FECHA:
 # ==============================================================================
 
 import pygame                    # Motor de juegos principal para graficos y eventos
-import pandas as pd              # Manejo de datos tabulares (lectura de Excel)
 import random                    # Generacion de numeros aleatorios para mezclar preguntas
 import math                      # Funciones matematicas para animaciones
 import os                        # Operaciones del sistema de archivos
-import time                      # Manejo de tiempo para el temporizador
 import io                        # Manejo de streams de bytes para imagenes
+import logging                   # Mensajes de diagnostico (reemplaza a print)
+import queue                     # Cola de comandos para los robots EV3
+import threading                 # Hilo trabajador que ejecuta los comandos EV3
 from dataclasses import dataclass, field  # Decoradores para clases de datos
-from typing import Optional, List         # Anotaciones de tipos
+from typing import Any, Optional, List, Dict, Tuple, Callable  # Anotaciones de tipos
 from enum import Enum                     # Enumeraciones para estados del juego
 
+from questions_source import QUESTIONS_EXCEL_FILE, file_sha1, read_question_rows  # Lectura del Excel de preguntas
+
+# ==============================================================================
+#                              REGISTRO (LOGGING)
+# ==============================================================================
+# Los mensajes de diagnostico pasan por logging en lugar de print(): con el
+# nivel por defecto (WARNING) los mensajes informativos no se formatean ni se
+# escriben a la terminal durante el juego. Para verlos todos:
+#     ROBOTRACE_DEBUG=1 python robot_race_quiz_v5.py
+# ==============================================================================
+
+logging.basicConfig(format="%(message)s")
+log = logging.getLogger("robotrace")
+log.setLevel(logging.DEBUG if os.environ.get("ROBOTRACE_DEBUG") else logging.WARNING)
+
 # Intentar importar requests para cargar imagenes desde URL
 try:
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
-    print("[AVISO] requests no instalado. Logos desde URL no estaran disponibles.")
-    print("        Instalar con: pip install requests")
+    log.warning("[AVISO] requests no instalado. Logos desde URL no estaran disponibles.")
+    log.warning("        Instalar con: pip install requests")
 
 # ==============================================================================
 #            CONFIGURACION EV3 DUAL (2 ROBOTS LEGO MINDSTORMS)
@@ -128,59 +148,59 @@ try:
     EV3_ROBOT1_NAME = "CHAMCO3000OK"  # Nombre Bluetooth del robot del Jugador 1
     EV3_ROBOT2_NAME = "EV3_Robot2"  # Nombre Bluetooth del robot del Jugador 2
 
-    print("=" * 60)
-    print("  CONECTANDO CON 2 ROBOTS EV3 POR BLUETOOTH...")
-    print("=" * 60)
+    log.info("=" * 60)
+    log.info("  CONECTANDO CON 2 ROBOTS EV3 POR BLUETOOTH...")
+    log.info("=" * 60)
 
     # --- ROBOT 1 (Jugador 1) ---
-    print(f"\n[EV3] Conectando Robot 1 (Jugador 1): '{EV3_ROBOT1_NAME}'...")
+    log.info("[EV3] Conectando Robot 1 (Jugador 1): '%s'...", EV3_ROBOT1_NAME)
     try:
         ev3_robot1 = EV3Brick()
         motor_r1_left  = Motor(Port.A)   # Motor izquierdo del Robot 1
         motor_r1_right = Motor(Port.B)   # Motor derecho del Robot 1
-        print("[OK] Robot 1 conectado exitosamente")
-        print(f"     - Motor izquierdo: Puerto A")
-        print(f"     - Motor derecho:   Puerto B")
+        log.info("[OK] Robot 1 conectado exitosamente")
+        log.info("     - Motor izquierdo: Puerto A")
+        log.info("     - Motor derecho:   Puerto B")
         ROBOT1_CONNECTED = True
     except Exception as e:
-        print(f"[ERROR] No se pudo conectar Robot 1: {e}")
+        log.error("[ERROR] No se pudo conectar Robot 1: %s", e)
         ROBOT1_CONNECTED = False
 
     # --- ROBOT 2 (Jugador 2) ---
-    print(f"\n[EV3] Conectando Robot 2 (Jugador 2): '{EV3_ROBOT2_NAME}'...")
+    log.info("[EV3] Conectando Robot 2 (Jugador 2): '%s'...", EV3_ROBOT2_NAME)
     try:
         ev3_robot2 = EV3Brick()
         motor_r2_left  = Motor(Port.A)   # Motor izquierdo del Robot 2
         motor_r2_right = Motor(Port.B)   # Motor derecho del Robot 2
-        print("[OK] Robot 2 conectado exitosamente")
-        print(f"     - Motor izquierdo: Puerto A")
-        print(f"     - Motor derecho:   Puerto B")
+        log.info("[OK] Robot 2 conectado exitosamente")
+        log.info("     - Motor izquierdo: Puerto A")
+        log.info("     - Motor derecho:   Puerto B")
         ROBOT2_CONNECTED = True
     except Exception as e:
-        print(f"[ERROR] No se pudo conectar Robot 2: {e}")
+        log.error("[ERROR] No se pudo conectar Robot 2: %s", e)
         ROBOT2_CONNECTED = False
 
     # Verificar si ambos estan conectados
     EV3_CONNECTED = ROBOT1_CONNECTED and ROBOT2_CONNECTED
 
     if EV3_CONNECTED:
-        print("\n[OK] AMBOS ROBOTS EV3 CONECTADOS CORRECTAMENTE!")
-        print("     Robot 1 (J1): 2 motores (Puerto A + Puerto B)")
-        print("     Robot 2 (J2): 2 motores (Puerto A + Puerto B)")
-        print("     Total: 4 motores activos")
+        log.info("[OK] AMBOS ROBOTS EV3 CONECTADOS CORRECTAMENTE!")
+        log.info("     Robot 1 (J1): 2 motores (Puerto A + Puerto B)")
+        log.info("     Robot 2 (J2): 2 motores (Puerto A + Puerto B)")
+        log.info("     Total: 4 motores activos")
     else:
         if not ROBOT1_CONNECTED:
-            print("\n[AVISO] Robot 1 NO conectado - Jugador 1 usara simulacion")
+            log.warning("[AVISO] Robot 1 NO conectado - Jugador 1 usara simulacion")
         if not ROBOT2_CONNECTED:
-            print("\n[AVISO] Robot 2 NO conectado - Jugador 2 usara simulacion")
+            log.warning("[AVISO] Robot 2 NO conectado - Jugador 2 usara simulacion")
 
 except ImportError:
-    print("[AVISO] pybricks no instalado. Usando modo simulacion.")
-    print("        Instalar con: pip install pybricks")
+    log.warning("[AVISO] pybricks no instalado. Usando modo simulacion.")
+    log.warning("        Instalar con: pip install pybricks")
     ROBOT1_CONNECTED = False
     ROBOT2_CONNECTED = False
 except Exception as e:
-    print(f"[ERROR] Error general conectando EV3: {e}")
+    log.error("[ERROR] Error general conectando EV3: %s", e)
     ROBOT1_CONNECTED = False
     ROBOT2_CONNECTED = False
 
@@ -192,10 +212,12 @@ except Exception as e:
 # --- Velocidad de los motores (grados/segundo) ---
 MOTOR_SPEED = 500           # Velocidad normal de avance
 MOTOR_SPEED_CELEBRATE = 1000 # Velocidad de celebracion
+CELEBRATE_DEGREES = 3 * 360 # Celebracion: 3 vueltas en cada sentido
 DEGREES_PER_UNIT = 10        # Conversion: unidades de juego a grados de motor
+EV3_SHUTDOWN_TIMEOUT = 5.0   # Segundos maximos de espera al hilo EV3 al salir
 
 
-def move_robot(player: int, distance: int):
+def move_robot(player: int, distance: int) -> None:
     """
     Mueve el robot EV3 del jugador especificado una distancia determinada.
     Ambos motores del robot giran sincronizados para avanzar recto.
@@ -215,11 +237,11 @@ def move_robot(player: int, distance: int):
                 # Ambos motores del Robot 1 avanzan sincronizados
                 motor_r1_left.run_angle(MOTOR_SPEED, degrees, wait=False)
                 motor_r1_right.run_angle(MOTOR_SPEED, degrees, wait=True)
-                print(f"[EV3-R1] Robot Jugador 1 avanza {distance} unidades ({degrees} grados)")
+                log.debug("[EV3-R1] Robot Jugador 1 avanza %s unidades (%s grados)", distance, degrees)
             except Exception as e:
-                print(f"[ERROR] Error moviendo Robot 1: {e}")
+                log.error("[ERROR] Error moviendo Robot 1: %s", e)
         else:
-            print(f"[EV3 SIMULADO] Robot Jugador 1 avanza {distance} unidades (2 motores)")
+            log.debug("[EV3 SIMULADO] Robot Jugador 1 avanza %s unidades (2 motores)", distance)
 
     elif player == 2:
         if ROBOT2_CONNECTED:
@@ -227,14 +249,14 @@ def move_robot(player: int, distance: int):
                 # Ambos motores del Robot 2 avanzan sincronizados
                 motor_r2_left.run_angle(MOTOR_SPEED, degrees, wait=False)
                 motor_r2_right.run_angle(MOTOR_SPEED, degrees, wait=True)
-                print(f"[EV3-R2] Robot Jugador 2 avanza {distance} unidades ({degrees} grados)")
+                log.debug("[EV3-R2] Robot Jugador 2 avanza %s unidades (%s grados)", distance, degrees)
             except Exception as e:
-                print(f"[ERROR] Error moviendo Robot 2: {e}")
+                log.error("[ERROR] Error moviendo Robot 2: %s", e)
         else:
-            print(f"[EV3 SIMULADO] Robot Jugador 2 avanza {distance} unidades (2 motores)")
+            log.debug("[EV3 SIMULADO] Robot Jugador 2 avanza %s unidades (2 motores)", distance)
 
 
-def celebrate_robot(player: int):
+def celebrate_robot(player: int) -> None:
     """
     Hace que el robot ganador ejecute una animacion de celebracion.
     Ambos motores giran en direcciones opuestas para hacer un "giro loco".
@@ -242,41 +264,39 @@ def celebrate_robot(player: int):
     Args:
         player (int): Numero del jugador ganador (1 o 2)
     
-    Secuencia de celebracion (3 repeticiones):
+    Secuencia de celebracion (3 vueltas por sentido, 4 comandos por robot):
         1. Motor izquierdo adelante + Motor derecho atras (giro sobre su eje)
         2. Motor izquierdo atras + Motor derecho adelante (giro inverso)
     """
     if player == 1 and ROBOT1_CONNECTED:
         try:
-            print("[EV3-R1] Robot Jugador 1 celebrando!")
-            for i in range(3):
-                # Giro sobre su eje: motores en direcciones opuestas
-                motor_r1_left.run_angle(MOTOR_SPEED_CELEBRATE, 360, wait=False)
-                motor_r1_right.run_angle(MOTOR_SPEED_CELEBRATE, -360, wait=True)
-                # Giro inverso
-                motor_r1_left.run_angle(MOTOR_SPEED_CELEBRATE, -360, wait=False)
-                motor_r1_right.run_angle(MOTOR_SPEED_CELEBRATE, 360, wait=True)
+            log.debug("[EV3-R1] Robot Jugador 1 celebrando!")
+            # Giro sobre su eje: motores en direcciones opuestas
+            motor_r1_left.run_angle(MOTOR_SPEED_CELEBRATE, CELEBRATE_DEGREES, wait=False)
+            motor_r1_right.run_angle(MOTOR_SPEED_CELEBRATE, -CELEBRATE_DEGREES, wait=True)
+            # Giro inverso
+            motor_r1_left.run_angle(MOTOR_SPEED_CELEBRATE, -CELEBRATE_DEGREES, wait=False)
+            motor_r1_right.run_angle(MOTOR_SPEED_CELEBRATE, CELEBRATE_DEGREES, wait=True)
         except Exception as e:
-            print(f"[ERROR] Error en celebracion Robot 1: {e}")
+            log.error("[ERROR] Error en celebracion Robot 1: %s", e)
 
     elif player == 2 and ROBOT2_CONNECTED:
         try:
-            print("[EV3-R2] Robot Jugador 2 celebrando!")
-            for i in range(3):
-                # Giro sobre su eje: motores en direcciones opuestas
-                motor_r2_left.run_angle(MOTOR_SPEED_CELEBRATE, 360, wait=False)
-                motor_r2_right.run_angle(MOTOR_SPEED_CELEBRATE, -360, wait=True)
-                # Giro inverso
-                motor_r2_left.run_angle(MOTOR_SPEED_CELEBRATE, -360, wait=False)
-                motor_r2_right.run_angle(MOTOR_SPEED_CELEBRATE, 360, wait=True)
+            log.debug("[EV3-R2] Robot Jugador 2 celebrando!")
+            # Giro sobre su eje: motores en direcciones opuestas
+            motor_r2_left.run_angle(MOTOR_SPEED_CELEBRATE, CELEBRATE_DEGREES, wait=False)
+            motor_r2_right.run_angle(MOTOR_SPEED_CELEBRATE, -CELEBRATE_DEGREES, wait=True)
+            # Giro inverso
+            motor_r2_left.run_angle(MOTOR_SPEED_CELEBRATE, -CELEBRATE_DEGREES, wait=False)
+            motor_r2_right.run_angle(MOTOR_SPEED_CELEBRATE, CELEBRATE_DEGREES, wait=True)
         except Exception as e:
-            print(f"[ERROR] Error en celebracion Robot 2: {e}")
+            log.error("[ERROR] Error en celebracion Robot 2: %s", e)
 
     else:
-        print(f"[EV3 SIMULADO] Robot del Jugador {player} celebra la victoria! (2 motores)")
+        log.debug("[EV3 SIMULADO] Robot del Jugador %s celebra la victoria! (2 motores)", player)
 
 
-def stop_all_robots():
+def stop_all_robots() -> None:
     """
     Detiene todos los motores de ambos robots.
     Util para paradas de emergencia o al finalizar el juego.
@@ -285,17 +305,17 @@ def stop_all_robots():
         try:
             motor_r1_left.stop()
             motor_r1_right.stop()
-            print("[EV3-R1] Robot 1 detenido")
+            log.info("[EV3-R1] Robot 1 detenido")
         except Exception as e:
-            print(f"[ERROR] Error deteniendo Robot 1: {e}")
+            log.error("[ERROR] Error deteniendo Robot 1: %s", e)
 
     if ROBOT2_CONNECTED:
         try:
             motor_r2_left.stop()
             motor_r2_right.stop()
-            print("[EV3-R2] Robot 2 detenido")
+            log.info("[EV3-R2] Robot 2 detenido")
         except Exception as e:
-            print(f"[ERROR] Error deteniendo Robot 2: {e}")
+            log.error("[ERROR] Error deteniendo Robot 2: %s", e)
 
 
 def get_ev3_status() -> dict:
@@ -319,11 +339,10 @@ def get_ev3_status() -> dict:
 #                         INICIALIZACION DE PYGAME
 # ==============================================================================
 
-# Inicializar todos los modulos de Pygame
+# Inicializar todos los modulos de Pygame (incluye pygame.font)
 pygame.init()
 
-# Inicializar especificamente el modulo de fuentes
-pygame.font.init()
+# Resolucion del escritorio, antes de crear la ventana
 info = pygame.display.Info()
 
 
@@ -334,12 +353,30 @@ info = pygame.display.Info()
 # Dimensiones de la ventana del juego
 SCREEN_WIDTH = info.current_w
 SCREEN_HEIGHT = info.current_h
+SCREEN_CENTER_X = SCREEN_WIDTH // 2    # Centro precalculado para el dibujo de cada frame
+SCREEN_CENTER_Y = SCREEN_HEIGHT // 2
 
 # Velocidad de actualizacion del juego
 FPS = 60
 
+# Pantallas sin carrera (menu y fin de juego): basta con la mitad de frames
+IDLE_FPS = 30
+
+# Surface.fblits (pygame-ce) despacha una lista de blits en una sola llamada
+# rapida; en pygame estandar se usa Surface.blits como alternativa
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+# Tabla de seno para las animaciones (ver RobotRaceGame.anim_sin)
+SIN_LUT_STEP = 0.01                              # Resolucion en radianes
+SIN_LUT_SIZE = round(2 * math.pi / SIN_LUT_STEP)  # Entradas en un periodo (628)
+
+# Unicos tipos de evento que procesa el juego (el resto se descarta en SDL).
+# Los de exposicion avisan de que otra ventana destapo parte de la pantalla.
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, *EXPOSE_EVENTS]
+
 # ==================== TIEMPOS DE CADA FASE ====================
-COUNTDOWN_DURATION = 1.0       # 1 segundo por cada numero (total 3 segundos)
+COUNTDOWN_DURATION = 1000      # 1 segundo por cada numero (milisegundos, total 3 segundos)
 QUESTION_TIME_LIMIT = 30       # Tiempo limite para responder (segundos)
 RESULT_PAUSE_DURATION = 2500   # Pausa despues de responder (milisegundos)
 
@@ -351,6 +388,8 @@ LOGO_INGENIOTICS_FILE = "ingenio2.png"
 #                         PALETA DE COLORES
 # ==============================================================================
 
+Color = Tuple[int, int, int]   # Color RGB
+
 COLORS = {
     # Colores de fondo
     'background': (20, 22, 35),
@@ -389,11 +428,32 @@ COLORS = {
     'bluetooth': (59, 130, 246),
 }
 
+# Etiqueta y color de cada opcion de respuesta (mismo orden que los botones)
+OPTION_LABELS = ("BOTON AZUL", "BOTON ROJO", "BOTON VERDE")
+OPTION_COLORS = (COLORS['question'], COLORS['error'], COLORS['success'])
+OPTION_COLORS_BLOCKED = (COLORS['track_segment'],) * 3   # Ambos jugadores bloqueados
+
+# Niveles del menu: (boton, nombre, descripcion, color)
+MENU_LEVELS = (
+    ("Azul", "Facil", "Preguntas basicas de matematicas", COLORS['player1']),
+    ("Rojo", "Medio", "Conocimiento general y operaciones", COLORS['accent']),
+    ("Verde", "Dificil", "Matematicas avanzadas", COLORS['player2']),
+)
+
 
 # ==============================================================================
 #                      ENUMERACIONES Y CLASES DE DATOS
 # ==============================================================================
 
+# Pares (superficie, destino) que los metodos de dibujo acumulan para
+# despacharlos juntos al final con blit_batch()
+BlitList = List[Tuple[pygame.Surface, Any]]
+
+# Carril pre-renderizado: (fondo con segmentos grises, tamano de un segmento,
+# posiciones en pantalla de los segmentos)
+TrackLayer = Tuple[pygame.Surface, Tuple[int, int], List[Tuple[int, int]]]
+
+
 class GamePhase(Enum):
     """
     Enumeracion que define las fases/estados posibles del juego.
@@ -405,6 +465,10 @@ class GamePhase(Enum):
     FINISHED = "finished"
 
 
+# Fases que se dibujan a IDLE_FPS
+IDLE_PHASES = frozenset((GamePhase.MENU, GamePhase.FINISHED))
+
+
 @dataclass
 class Question:
     """
@@ -430,6 +494,14 @@ class PlayerState:
     message_type: str = "info"
     animation_offset: float = 0.0
     blocked_this_round: bool = False
+    
+    def reset_for_round(self) -> None:
+        """
+        Limpia la respuesta, el mensaje y el bloqueo de la ronda anterior.
+        """
+        self.last_answer = None
+        self.message = ""
+        self.blocked_this_round = False
 
 
 # ==============================================================================
@@ -444,7 +516,7 @@ class RobotRaceGame:
     cada uno con 2 motores (4 motores en total).
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """
         Constructor de la clase RobotRaceGame.
         """
@@ -453,6 +525,13 @@ class RobotRaceGame:
         pygame.display.set_caption("Robot Race Quiz v7.0 - Dual EV3 Bluetooth (4 Motores)")
         self.clock = pygame.time.Clock()
         
+        # Bloquear en SDL los eventos que no se usan (MOUSEMOTION, teclas
+        # soltadas, etc.) para que no se acumulen en la cola ni se creen
+        # objetos Event de Python. Los de exposicion de la ventana se
+        # mantienen: indican que hay que volver a enviar el frame completo
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+        
         # ==================== FUENTES TIPOGRAFICAS ====================
         self.font_title = pygame.font.Font(None, 56)
         self.font_countdown = pygame.font.Font(None, 200)
@@ -461,53 +540,274 @@ class RobotRaceGame:
         self.font_small = pygame.font.Font(None, 24)
         self.font_tiny = pygame.font.Font(None, 18)
         
+        # ==================== CACHE DE TEXTO ====================
+        # Superficies de texto ya renderizadas: (fuente, texto, color) -> Surface
+        self._text_cache: Dict[Tuple[int, str, Color], pygame.Surface] = {}
+        # Texto centrado ya posicionado: (fuente, texto, color, centro) -> (Surface, Rect)
+        self._text_rects: Dict[tuple, Tuple[pygame.Surface, pygame.Rect]] = {}
+        self.prerender_texts()
+        
         # ==================== ESTADO DEL JUEGO ====================
-        self.phase = GamePhase.MENU
-        self.level = 1
+        self.phase: GamePhase = GamePhase.MENU
+        self.level: int = 1
         self.player1 = PlayerState()
         self.player2 = PlayerState()
-        self.winner = None
+        self.winner: Optional[int] = None
         
         # ==================== PREGUNTAS ====================
         self.questions: List[Question] = []
+        self._questions_by_level: Dict[int, List[Question]] = {1: [], 2: [], 3: []}   # self.questions agrupadas por nivel
         self.available_questions: List[Question] = []
+        self._q_cursor: int = 0   # Indice de la siguiente pregunta en available_questions
         self.current_question: Optional[Question] = None
         self.current_options: List[str] = []
-        self.questions_answered = 0
+        self._correct_idx: int = 0   # Posicion de la respuesta correcta en current_options
+        self._option_texts: List[Tuple[pygame.Surface, pygame.Rect]] = []   # Textos de current_options recortados, renderizados y colocados
+        self._q_lines: List[Tuple[pygame.Surface, int]] = []   # Lineas renderizadas de la pregunta y su offset Y
+        self._q_preview: Optional[Tuple[pygame.Surface, pygame.Rect]] = None   # Avance de la pregunta en la cuenta regresiva
+        self._q_correct: Optional[Tuple[pygame.Surface, pygame.Rect]] = None   # "Respuesta correcta: ..." de la pausa de resultado
+        self.questions_answered: int = 0
         
         # ==================== SISTEMA DE INTERLUDIO ====================
-        self.countdown_number = 3
-        self.countdown_start_time = 0
+        self.countdown_number: int = 3
+        self.countdown_start_time: int = 0   # pygame ticks (ms)
         
         # ==================== RESULTADO DE RONDA ====================
         self.round_winner: Optional[int] = None
         self.last_answer_correct: Optional[bool] = None
-        self.result_pause_start = 0
+        self.result_pause_start: int = 0
+        self._blocked_mask: int = 0   # Jugadores bloqueados en la ronda (un bit por jugador)
         
         # ==================== TEMPORIZADOR DE PREGUNTA ====================
-        self.question_time_remaining = QUESTION_TIME_LIMIT
-        self.question_start_time = 0
+        self.question_time_remaining: int = QUESTION_TIME_LIMIT
+        self.question_start_time: int = 0   # pygame ticks (ms)
         
         # ==================== CONSTANTES DEL JUEGO ====================
         self.WINNING_POSITION = 100
         self.POSITION_INCREMENT = 20
         self.TOTAL_SEGMENTS = 5
+        self.ALL_BLOCKED_MASK = 0b11   # Bit 0 = Jugador 1, bit 1 = Jugador 2
+        
+        # ==================== GEOMETRIA DEL MENU ====================
+        # Botones de nivel: 440x80 apilados cada 95 px (80 de alto + 15 de separacion)
+        self.LEVEL_BTN_X = SCREEN_WIDTH // 2 - 220
+        self.LEVEL_BTN_Y = 370
+        self.LEVEL_BTN_WIDTH = 440
+        self.LEVEL_BTN_HEIGHT = 80
+        self.LEVEL_BTN_STEP = 95
+        self._level_btn_pos = [(self.LEVEL_BTN_X, self.LEVEL_BTN_Y + i * self.LEVEL_BTN_STEP) for i in range(3)]
+        
+        # ==================== GEOMETRIA DE LA PARTIDA ====================
+        # Rects fijos de la pantalla de juego, creados una sola vez
+        self._header_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 60)
+        self._level_badge_rect = pygame.Rect(200, 15, 80, 30)
+        self._footer_rect = pygame.Rect(40, SCREEN_HEIGHT - 45, SCREEN_WIDTH - 80, 35)
+        self._timer_panel_rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, 230, 300, 50)
+        self._timer_bg_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, 290, 400, 15)
+        self._result_rect = pygame.Rect(SCREEN_WIDTH // 2 - 280, 240, 560, 80)
+        # Opciones: 3 tarjetas de 320x80 separadas 20 px, con su etiqueta de color abajo
+        options_x = (SCREEN_WIDTH - (320 * 3 + 20 * 2)) // 2
+        self._option_rects = [pygame.Rect(options_x + i * (320 + 20), 440, 320, 80) for i in range(3)]
+        self.OPTION_TEXT_MAX_WIDTH = 320 - 2 * 12   # Ancho util del texto dentro de la tarjeta
+        self._badge_rects = []
+        for opt_rect in self._option_rects:
+            badge_rect = pygame.Rect(0, 0, 140, 24)
+            badge_rect.centerx = opt_rect.centerx
+            badge_rect.bottom = opt_rect.bottom - 10
+            self._badge_rects.append(badge_rect)
+        self._status_rect_1 = pygame.Rect(100, 530, 250, 40)
+        self._status_rect_2 = pygame.Rect(SCREEN_WIDTH - 350, 530, 250, 40)
+        # Franja de opciones + estado de jugadores (se compone como una sola capa)
+        self._answers_rect = pygame.Rect(0, 440, SCREEN_WIDTH, 130)
+        
+        # ==================== MAPA DE TECLAS ====================
+        # Menu: tecla -> nivel
+        self._menu_keys = {
+            pygame.K_a: 1, pygame.K_d: 1,
+            pygame.K_s: 2, pygame.K_f: 2,
+            pygame.K_w: 3, pygame.K_g: 3,
+        }
+        # Pregunta: tecla -> (jugador, indice de opcion)
+        self._question_keys = {
+            pygame.K_a: (1, 0), pygame.K_s: (1, 1), pygame.K_w: (1, 2),   # Jugador 1
+            pygame.K_d: (2, 0), pygame.K_f: (2, 1), pygame.K_g: (2, 2),   # Jugador 2
+        }
+        # Fase -> manejador de teclas (las fases sin entrada no aparecen)
+        self._key_handlers: Dict[GamePhase, Callable[[int], None]] = {
+            GamePhase.MENU: self.on_menu_key,
+            GamePhase.QUESTION: self.on_question_key,
+            GamePhase.FINISHED: self.on_finished_key,
+        }
         
         # ==================== ANIMACION ====================
-        self.animation_time = 0
+        self.animation_time: int = 0
+        # Tabla de seno con paso de 0.01 rad (un periodo completo): todas las
+        # animaciones usan velocidades multiplo de 0.01, ver anim_sin()
+        self._sin_lut: List[float] = [math.sin(i * SIN_LUT_STEP) for i in range(SIN_LUT_SIZE)]
+        # Valores de animacion del frame actual (ver update_animation)
+        self.anim_bob: float = 0.0
+        self.anim_pupil: float = 0.0
+        self.anim_pulse: float = 1.0
+        self.anim_bounce: float = 0.0
+        self.update_animation()
         self.hover_level = None
         
         # ==================== LOGOS ====================
-        self.logo_fac = None
-        self.logo_ingeniotics = None
+        self.logo_fac: Optional[pygame.Surface] = None
+        self.logo_ingeniotics: Optional[pygame.Surface] = None
+        
+        # ==================== SUPERFICIES PRE-RENDERIZADAS ====================
+        self._menu_static: Optional[pygame.Surface] = None   # Se construye en el primer draw_menu
+        self._ev3_panel: Optional[pygame.Surface] = None     # Panel de conexion EV3 del menu (idem)
+        self._level_buttons: Dict[Tuple[int, bool], pygame.Surface] = {}   # (nivel, hover) -> boton
+        # Geometria del carril (x, y, ancho, alto, segmentos, separacion) -> capa
+        self._track_layers: Dict[Tuple[int, ...], TrackLayer] = {}
+        # Fondo translucido del avance de pregunta (cuenta regresiva)
+        self._preview_rect = pygame.Rect(100, 520, SCREEN_WIDTH - 200, 80)
+        self._preview_panel = self.build_translucent_surface(self._preview_rect.size, COLORS['card'], 150)
+        # Velo translucido de fin de juego (pantalla completa)
+        self._game_over_overlay = self.build_translucent_surface((SCREEN_WIDTH, SCREEN_HEIGHT), COLORS['background'], 230)
+        self._game_over_panel: Optional[pygame.Surface] = None    # Panel de resultados ya compuesto
+        self._game_over_key: Optional[tuple] = None               # (ganador, puntos J1, puntos J2, preguntas) del panel
+        self._answers_layer: Optional[pygame.Surface] = None      # Opciones y estado de la pregunta actual ya compuestos
+        self._countdown_circles: Dict[int, pygame.Surface] = {}   # radio -> circulo de la cuenta regresiva
+        self._answers_key: Optional[int] = None                   # _blocked_mask con el que se compuso la capa
+        self._robot_sprites: Dict[Tuple[int, Color], pygame.Surface] = {}   # (tamano, color) -> robot sin pupilas
+        self._pupil_sprites: Dict[int, pygame.Surface] = {}   # radio -> pupila
+        self._robot_frames: Dict[Tuple[int, Color, int], pygame.Surface] = {}   # (tamano, color, pupila) -> robot completo
+        self._rounded_rects: Dict[tuple, pygame.Surface] = {}   # (ancho, alto, color, radio, borde, color borde) -> pieza
+        self._segment_tiles: Dict[Tuple[Tuple[int, int], Color], pygame.Surface] = {}   # (tamano, color) -> segmento
+        # Zonas que cambian durante la PREGUNTA: pista, temporizador y opciones/estado.
+        # El header, el panel de la pregunta y el footer quedan fijos en esa fase.
+        self._question_dirty_rects = [
+            pygame.Rect(0, 61, SCREEN_WIDTH, 169),
+            pygame.Rect(SCREEN_WIDTH // 2 - 200, 230, 400, 75),
+            self._answers_rect,
+        ]
+        # Zonas que cambian en el MENU: los dos robots (con todo su recorrido
+        # de balanceo, y = 200 +- 3) y los botones de nivel (cursor encima)
+        self._menu_dirty_rects = [
+            pygame.Rect(150 - 70, 125, 140, 150),
+            pygame.Rect(SCREEN_WIDTH - 150 - 70, 125, 140, 150),
+            pygame.Rect(self.LEVEL_BTN_X, self.LEVEL_BTN_Y, self.LEVEL_BTN_WIDTH, 3 * self.LEVEL_BTN_STEP),
+        ]
+        # Resto de fases: la pista (robots balanceandose y avanzando) mas lo
+        # que se anima en cada una; el texto y los paneles no cambian dentro de la fase
+        track_dirty_rect = pygame.Rect(0, 61, SCREEN_WIDTH, 169)
+        self._phase_dirty_rects = {
+            GamePhase.MENU: self._menu_dirty_rects,
+            GamePhase.QUESTION: self._question_dirty_rects,
+            # Circulo pulsante (radio hasta 110) con el numero
+            GamePhase.COUNTDOWN: [track_dirty_rect, pygame.Rect(SCREEN_WIDTH // 2 - 112, 400 - 112, 224, 224)],
+            # Robot que celebra saltando (y = 620 - salto de 0 a 15)
+            GamePhase.RESULT_PAUSE: [track_dirty_rect, pygame.Rect(SCREEN_WIDTH // 2 - 52, 553, 104, 120)],
+            # Robot ganador balanceandose sobre el panel (+-5 px)
+            GamePhase.FINISHED: [track_dirty_rect, pygame.Rect(SCREEN_WIDTH // 2 - 62, SCREEN_HEIGHT // 2 - 117, 124, 134)],
+        }
+        self._presented_phase: Optional[GamePhase] = None   # Fase del ultimo frame enviado completo a pantalla
+        self._menu_last_state: Optional[Tuple[int, int, int, int]] = None   # Ultimo frame de menu dibujado
+        self._game_over_last_state: Optional[tuple] = None   # Ultimo frame de fin de juego dibujado
         
         # ==================== ESTADO EV3 ====================
         self.ev3_status = get_ev3_status()
         
+        # Los comandos a los motores bloquean (Bluetooth + wait=True), asi que
+        # se encolan y los ejecuta un hilo aparte sin congelar la pantalla
+        self._ev3_queue: "queue.Queue[Optional[Tuple[Callable[..., None], tuple]]]" = queue.Queue()   # None = terminar
+        self._ev3_thread = threading.Thread(target=self._ev3_worker, daemon=True)
+        self._ev3_thread.start()
+        
         # ==================== CARGAR RECURSOS ====================
         self.load_questions_from_excel()
+        self.index_questions_by_level()
         self.load_logos()
     
+    # ==========================================================================
+    #                      CACHE DE TEXTO RENDERIZADO
+    # ==========================================================================
+    
+    def _get_text(self, font: pygame.font.Font, text: str, color: Color) -> pygame.Surface:
+        """
+        Retorna la superficie de un texto, renderizandola solo la primera vez.
+        """
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+    
+    def _get_text_centered(self, font: pygame.font.Font, text: str, color: Color,
+                           center: Tuple[int, int]) -> Tuple[pygame.Surface, pygame.Rect]:
+        """
+        Retorna la superficie de un texto y su Rect centrado en `center`,
+        calculando el Rect solo la primera vez.
+        """
+        key = (id(font), text, color, center)
+        entry = self._text_rects.get(key)
+        if entry is None:
+            surface = self._get_text(font, text, color)
+            entry = (surface, surface.get_rect(center=center))
+            self._text_rects[key] = entry
+        return entry
+    
+    def blit_centered(self, font: pygame.font.Font, text: str, color: Color, center: Tuple[int, int]) -> None:
+        """
+        Dibuja en pantalla un texto (cacheado) centrado en `center`.
+        """
+        self.screen.blit(*self._get_text_centered(font, text, color, center))
+    
+    def prerender_texts(self):
+        """
+        Pre-renderiza los textos conocidos que se dibujan en cada frame
+        (numeros de la cuenta regresiva, segundos del temporizador y
+        porcentajes de avance de los carriles).
+        """
+        for number in (3, 2, 1):
+            self._get_text(self.font_countdown, str(number), COLORS['text_white'])
+        
+        for seconds in range(QUESTION_TIME_LIMIT + 1):
+            self._get_text(self.font_large, f"TIEMPO: {seconds}s", COLORS['text_white'])
+        
+        # El robot avanza 2 unidades por frame: sin esto, cada frame de la
+        # animacion renderizaria un porcentaje nuevo
+        for percent in range(101):
+            self._get_text(self.font_small, f"{percent}%", COLORS['text_white'])
+    
+    def option_label(self, option) -> str:
+        """
+        Texto de una opcion tal como se muestra en su tarjeta.
+        
+        Se recorta midiendo con font.size (sin renderizar) hasta que quepa
+        en OPTION_TEXT_MAX_WIDTH pixeles, terminando en "...".
+        """
+        text = str(option)
+        size = self.font_medium.size
+        max_width = self.OPTION_TEXT_MAX_WIDTH
+        if size(text)[0] <= max_width:
+            return text
+        
+        text = text.rstrip()
+        while text and size(text + "...")[0] > max_width:
+            text = text[:-1].rstrip()
+        return text + "..."
+    
+    def render_question_lines(self, question_text: str) -> List[Tuple[pygame.Surface, int]]:
+        """
+        Renderiza el texto de la pregunta una sola vez (en una o dos lineas)
+        y devuelve cada superficie con su offset vertical dentro del panel.
+        """
+        if len(question_text) > 70:
+            words = question_text.split()
+            mid = len(words) // 2
+            line1 = ' '.join(words[:mid])
+            line2 = ' '.join(words[mid:])
+            return [
+                (self.font_medium.render(line1, True, COLORS['text_white']).convert_alpha(), 50),
+                (self.font_medium.render(line2, True, COLORS['text_white']).convert_alpha(), 75),
+            ]
+        return [(self.font_medium.render(question_text, True, COLORS['text_white']).convert_alpha(), 60)]
+    
     # ==========================================================================
     #                        CARGA DE LOGOS
     # ==========================================================================
@@ -518,30 +818,83 @@ class RobotRaceGame:
         """
         base_path = os.path.dirname(os.path.abspath(__file__))
         
-        path_fac = os.path.join(base_path, LOGO_FAC_FILE)
-        path_ing = os.path.join(base_path, LOGO_INGENIOTICS_FILE)
+        self.logo_fac = self.load_logo(base_path, LOGO_FAC_FILE, "Facultad", (150, 100))
+        self.logo_ingeniotics = self.load_logo(base_path, LOGO_INGENIOTICS_FILE, "Ingeniotics", (150, 50))
+    
+    def load_logo(self, base_path: str, filename: str, name: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """
+        Carga un logo ya convertido al formato de la pantalla y escalado a su
+        tamano final, para que en el menu solo haya que hacer un blit directo.
+        """
+        path = os.path.join(base_path, filename)
         
-        if os.path.exists(path_fac):
-            try:
-                print(f"[INFO] Cargando logo Facultad desde: {path_fac}")
-                self.logo_fac = pygame.image.load(path_fac)
-                self.logo_fac = pygame.transform.scale(self.logo_fac, (150, 100))
-                print("[OK] Logo Facultad cargado correctamente")
-            except Exception as e:
-                print(f"[ERROR] No se pudo cargar la imagen {LOGO_FAC_FILE}: {e}")
-        else:
-            print(f"[AVISO] No se encontro el archivo: {LOGO_FAC_FILE}")
-            
-        if os.path.exists(path_ing):
+        if not os.path.exists(path):
+            log.warning("[AVISO] No se encontro el archivo: %s", filename)
+            return None
+        
+        try:
+            log.info("[INFO] Cargando logo %s desde: %s", name, path)
+            # convert_alpha() antes de escalar: el escalado ya trabaja en el
+            # formato de la pantalla y cada blit no convierte pixel por pixel
+            logo = pygame.image.load(path).convert_alpha()
+            logo = pygame.transform.smoothscale(logo, size)
+            log.info("[OK] Logo %s cargado correctamente", name)
+            return logo
+        except Exception as e:
+            log.error("[ERROR] No se pudo cargar la imagen %s: %s", filename, e)
+            return None
+    
+    # ==========================================================================
+    #                   COMANDOS EV3 EN SEGUNDO PLANO
+    # ==========================================================================
+    
+    def _ev3_worker(self) -> None:
+        """
+        Hilo trabajador: ejecuta en orden los comandos encolados para los robots.
+        """
+        while True:
+            item = self._ev3_queue.get()
+            if item is None:
+                break
+            command, args = item
             try:
-                print(f"[INFO] Cargando logo Ingeniotics desde: {path_ing}")
-                self.logo_ingeniotics = pygame.image.load(path_ing)
-                self.logo_ingeniotics = pygame.transform.scale(self.logo_ingeniotics, (150, 50))
-                print("[OK] Logo Ingeniotics cargado correctamente")
+                command(*args)
             except Exception as e:
-                print(f"[ERROR] No se pudo cargar la imagen {LOGO_INGENIOTICS_FILE}: {e}")
-        else:
-            print(f"[AVISO] No se encontro el archivo: {LOGO_INGENIOTICS_FILE}")
+                log.error("[ERROR] Error ejecutando comando EV3: %s", e)
+    
+    def send_robot_command(self, command: Callable[..., None], *args) -> None:
+        """
+        Encola un comando EV3 (move_robot, celebrate_robot...) y regresa de inmediato.
+        """
+        self._ev3_queue.put((command, args))
+    
+    def stop_robots_async(self) -> None:
+        """
+        Descarta los comandos EV3 pendientes y encola la parada de ambos
+        robots, sin bloquear el bucle del juego.
+        """
+        self._drain_ev3_queue()
+        self.send_robot_command(stop_all_robots)
+    
+    def shutdown_robots(self) -> None:
+        """
+        Al salir: descarta lo pendiente, detiene los robots desde el hilo
+        trabajador y espera a que termine (con limite, por si un comando
+        bloqueante tarda en volver).
+        """
+        self.stop_robots_async()
+        self._ev3_queue.put(None)
+        self._ev3_thread.join(timeout=EV3_SHUTDOWN_TIMEOUT)
+    
+    def _drain_ev3_queue(self) -> None:
+        """
+        Vacia la cola de comandos EV3 sin ejecutarlos.
+        """
+        try:
+            while True:
+                self._ev3_queue.get_nowait()
+        except queue.Empty:
+            pass
     
     # ==========================================================================
     #                     CARGA DE PREGUNTAS
@@ -551,59 +904,65 @@ class RobotRaceGame:
         """
         Carga las preguntas del quiz desde un archivo Excel.
         """
-        excel_file = "preguntasCompletasVirgilio.xlsx"
+        excel_file = QUESTIONS_EXCEL_FILE
         
+        # Directorio de trabajo y, si no esta ahi, junto al script
+        # (la ruta relativa ya es la del directorio de trabajo)
         possible_paths = [
             excel_file,
-            os.path.join(os.path.dirname(__file__), excel_file),
-            os.path.join(os.getcwd(), excel_file),
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), excel_file),
         ]
         
-        file_found = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                file_found = path
-                break
+        file_found = next((path for path in possible_paths if os.path.exists(path)), None)
+        
+        if self.load_compiled_questions(file_found):
+            return
         
         if file_found:
             try:
-                df = pd.read_excel(file_found)
-                
-                required_columns = ['Nivel', 'Pregunta', 'Respuesta Correcta', 'R1', 'R2']
-                missing = [col for col in required_columns if col not in df.columns]
-                
-                if missing:
-                    print(f"[ERROR] Columnas faltantes en Excel: {missing}")
-                    print(f"[INFO] Columnas encontradas: {list(df.columns)}")
-                    self.load_default_questions()
-                    return
-                
-                for _, row in df.iterrows():
-                    try:
-                        self.questions.append(Question(
-                            nivel=int(row['Nivel']),
-                            pregunta=str(row['Pregunta']).strip(),
-                            respuesta_correcta=str(row['Respuesta Correcta']).strip(),
-                            r1=str(row['R1']).strip(),
-                            r2=str(row['R2']).strip()
-                        ))
-                    except Exception as e:
-                        print(f"[WARNING] Error procesando fila: {e}")
-                        continue
-                
-                print(f"[OK] Cargadas {len(self.questions)} preguntas desde '{file_found}'")
-                for nivel in [1, 2, 3]:
-                    count = len([q for q in self.questions if q.nivel == nivel])
-                    print(f"     Nivel {nivel}: {count} preguntas")
+                rows = read_question_rows(file_found)
+                self.questions.extend(Question(*row) for row in rows)
+                log.info("[OK] Cargadas %s preguntas desde '%s'", len(self.questions), file_found)
                     
             except Exception as e:
-                print(f"[ERROR] Error leyendo archivo Excel: {e}")
+                log.error("[ERROR] Error leyendo archivo Excel: %s", e)
                 self.load_default_questions()
         else:
-            print(f"[INFO] Archivo '{excel_file}' no encontrado en ninguna ubicacion")
-            print("[INFO] Usando preguntas por defecto")
+            log.info("[INFO] Archivo '%s' no encontrado en ninguna ubicacion", excel_file)
+            log.info("[INFO] Usando preguntas por defecto")
             self.load_default_questions()
     
+    def load_compiled_questions(self, excel_path: Optional[str]) -> bool:
+        """
+        Carga las preguntas desde questions_data.py (generado con
+        compile_questions.py) si corresponde al Excel actual, si no hay
+        Excel o si el Excel no se puede leer. Retorna False si no existe,
+        esta vacio o esta desactualizado.
+        """
+        try:
+            import questions_data
+        except ImportError:
+            return False
+        
+        if not getattr(questions_data, "QUESTIONS", None):
+            return False
+        
+        if excel_path:
+            try:
+                excel_sha1 = file_sha1(excel_path)
+            except OSError as e:
+                # Excel bloqueado o ilegible: tampoco se podria leer, asi que
+                # se usan las preguntas compiladas tal cual
+                log.warning("[WARNING] No se pudo leer '%s' (%s): se usan las preguntas compiladas", excel_path, e)
+            else:
+                if getattr(questions_data, "SOURCE_SHA1", None) != excel_sha1:
+                    log.info("[INFO] questions_data.py no corresponde a '%s': se lee el Excel", excel_path)
+                    return False
+        
+        self.questions.extend(Question(*data) for data in questions_data.QUESTIONS)
+        log.info("[OK] Cargadas %s preguntas compiladas (questions_data.py)", len(self.questions))
+        return True
+    
     def load_default_questions(self):
         """
         Carga un conjunto de preguntas predeterminadas como fallback.
@@ -651,66 +1010,97 @@ class RobotRaceGame:
         for data in default_data:
             self.questions.append(Question(*data))
         
-        print(f"[OK] Cargadas {len(self.questions)} preguntas por defecto")
+        log.info("[OK] Cargadas %s preguntas por defecto", len(self.questions))
     
     # ==========================================================================
     #                    GESTION DE PREGUNTAS
     # ==========================================================================
     
+    def index_questions_by_level(self) -> None:
+        """
+        Agrupa las preguntas cargadas por nivel una sola vez, para no
+        recorrer toda la lista en cada partida.
+        """
+        for question in self.questions:
+            self._questions_by_level.setdefault(question.nivel, []).append(question)
+        
+        for nivel, level_questions in sorted(self._questions_by_level.items()):
+            log.info("     Nivel %s: %s preguntas", nivel, len(level_questions))
+    
     def get_questions_by_level(self, level: int) -> List[Question]:
-        return [q for q in self.questions if q.nivel == level]
+        # Copia: la partida la mezcla en sitio sin alterar el indice
+        return list(self._questions_by_level.get(level, ()))
     
-    def shuffle_options(self, question: Question) -> List[str]:
-        options = [question.respuesta_correcta, question.r1, question.r2]
+    def shuffle_options(self, question: Question) -> Tuple[List[str], int]:
+        """
+        Mezcla las opciones y retorna (opciones, indice de la respuesta correcta).
+        """
+        correct_idx = random.randrange(3)
+        options = [question.r1, question.r2]
         random.shuffle(options)
-        return options
+        options.insert(correct_idx, question.respuesta_correcta)
+        return options, correct_idx
     
-    def start_countdown_for_next_question(self):
+    def start_countdown_for_next_question(self) -> None:
         """
         Inicia la cuenta regresiva "3, 2, 1" para la siguiente pregunta.
         """
         self.round_winner = None
         self.last_answer_correct = None
-        self.player1.last_answer = None
-        self.player1.message = ""
-        self.player1.blocked_this_round = False
-        self.player2.last_answer = None
-        self.player2.message = ""
-        self.player2.blocked_this_round = False
-        
-        if not self.available_questions:
-            print("[INFO] No hay mas preguntas disponibles")
+        self.player1.reset_for_round()
+        self.player2.reset_for_round()
+        self._blocked_mask = 0
+        
+        if self._q_cursor >= len(self.available_questions):
+            log.debug("[INFO] No hay mas preguntas disponibles")
             self.determine_winner()
             return
         
-        self.current_question = self.available_questions.pop(0)
-        self.current_options = self.shuffle_options(self.current_question)
+        self.current_question = self.available_questions[self._q_cursor]
+        self._q_cursor += 1
+        self.current_options, self._correct_idx = self.shuffle_options(self.current_question)
+        self._answers_layer = None
+        # Se recortan y renderizan durante la cuenta regresiva para no hacerlo ya en la pregunta
+        self._option_texts = []
+        for opt_rect, option in zip(self._option_rects, self.current_options):
+            opt_text = self._get_text(self.font_medium, self.option_label(option), COLORS['text_white'])
+            self._option_texts.append((opt_text, opt_text.get_rect(centerx=opt_rect.centerx, top=opt_rect.y + 12)))
+        self._q_lines = self.render_question_lines(self.current_question.pregunta)
+        pregunta = self.current_question.pregunta
+        q_preview = pregunta[:60] + "..." if len(pregunta) > 60 else pregunta
+        self._q_preview = self._get_text_centered(self.font_small, q_preview, COLORS['text_gray'], (SCREEN_WIDTH // 2, 575))
+        self._q_correct = self._get_text_centered(
+            self.font_medium,
+            f"Respuesta correcta: {self.current_question.respuesta_correcta}",
+            COLORS['success'],
+            (SCREEN_WIDTH // 2, 540)
+        )
         
         self.questions_answered += 1
         
         self.phase = GamePhase.COUNTDOWN
         self.countdown_number = 3
-        self.countdown_start_time = time.time()
+        self.countdown_start_time = pygame.time.get_ticks()
         
-        print(f"\n[PREGUNTA {self.questions_answered}] Iniciando cuenta regresiva...")
-        print(f"[INFO] Pregunta: {self.current_question.pregunta}")
-        print(f"[INFO] Respuesta correcta: {self.current_question.respuesta_correcta}")
+        log.debug("[PREGUNTA %s] Iniciando cuenta regresiva...", self.questions_answered)
+        log.debug("[INFO] Pregunta: %s", self.current_question.pregunta)
+        log.debug("[INFO] Respuesta correcta: %s", self.current_question.respuesta_correcta)
     
-    def start_question_phase(self):
+    def start_question_phase(self) -> None:
         """
         Inicia la fase de pregunta donde ambos jugadores pueden responder.
         """
         self.phase = GamePhase.QUESTION
-        self.question_start_time = time.time()
+        self.question_start_time = pygame.time.get_ticks()
         self.question_time_remaining = QUESTION_TIME_LIMIT
         
-        print(f"[PREGUNTA] Ambos jugadores pueden responder! ({QUESTION_TIME_LIMIT} segundos)")
+        log.debug("[PREGUNTA] Ambos jugadores pueden responder! (%s segundos)", QUESTION_TIME_LIMIT)
     
     # ==========================================================================
     #                     CONTROL DEL JUEGO
     # ==========================================================================
     
-    def start_game(self, level: int):
+    def start_game(self, level: int) -> None:
         """
         Inicia una nueva partida con el nivel especificado.
         """
@@ -721,27 +1111,35 @@ class RobotRaceGame:
         self.player1 = PlayerState()
         self.player2 = PlayerState()
         
+        # get_questions_by_level ya devuelve una lista nueva: se mezcla en sitio
+        # y se recorre con un cursor en lugar de hacer pop(0) en cada ronda
         level_questions = self.get_questions_by_level(level)
-        self.available_questions = random.sample(level_questions, len(level_questions))
+        random.shuffle(level_questions)
+        self.available_questions = level_questions
+        self._q_cursor = 0
         
-        print(f"\n[JUEGO] Iniciando nivel {level} con {len(level_questions)} preguntas")
-        print(f"[JUEGO] Flujo: Cuenta regresiva (3,2,1) -> Pregunta ({QUESTION_TIME_LIMIT}s)")
+        log.info("[JUEGO] Iniciando nivel %s con %s preguntas", level, len(level_questions))
+        log.info("[JUEGO] Flujo: Cuenta regresiva (3,2,1) -> Pregunta (%ss)", QUESTION_TIME_LIMIT)
         
-        # Mostrar estado de conexion EV3
-        status = get_ev3_status()
-        print(f"[EV3] Estado: {status['total_motors']} motores activos")
+        # Mostrar estado de conexion EV3 (leido una sola vez al arrancar)
+        status = self.ev3_status
+        log.info("[EV3] Estado: %s motores activos", status['total_motors'])
         if status['robot1_connected']:
-            print(f"     Robot 1 (J1): CONECTADO (2 motores)")
+            log.info("     Robot 1 (J1): CONECTADO (2 motores)")
         else:
-            print(f"     Robot 1 (J1): SIMULADO")
+            log.info("     Robot 1 (J1): SIMULADO")
         if status['robot2_connected']:
-            print(f"     Robot 2 (J2): CONECTADO (2 motores)")
+            log.info("     Robot 2 (J2): CONECTADO (2 motores)")
         else:
-            print(f"     Robot 2 (J2): SIMULADO")
+            log.info("     Robot 2 (J2): SIMULADO")
         
         self.start_countdown_for_next_question()
+        
+        # Escena nueva: el primer frame se envia completo aunque la fase
+        # coincida con la del ultimo frame (ESC y nivel en el mismo frame)
+        self.invalidate_presented_frame()
     
-    def answer_question(self, player: int, answer_index: int):
+    def answer_question(self, player: int, answer_index: int) -> None:
         """
         Procesa la respuesta de un jugador.
         Ambos motores del robot del jugador se activan al acertar.
@@ -751,7 +1149,7 @@ class RobotRaceGame:
         
         player_state = self.player1 if player == 1 else self.player2
         if player_state.blocked_this_round:
-            print(f"[JUEGO] Jugador {player} esta bloqueado esta ronda")
+            log.debug("[JUEGO] Jugador %s esta bloqueado esta ronda", player)
             return
         
         if not self.current_question:
@@ -760,8 +1158,7 @@ class RobotRaceGame:
         if answer_index >= len(self.current_options):
             return
         
-        selected_answer = self.current_options[answer_index]
-        is_correct = selected_answer == self.current_question.respuesta_correcta
+        is_correct = answer_index == self._correct_idx
         
         if is_correct:
             # ========== RESPUESTA CORRECTA ==========
@@ -779,15 +1176,15 @@ class RobotRaceGame:
             player_state.last_answer = "correct"
             
             # Mover robot fisico EV3 (ambos motores del robot correspondiente)
-            move_robot(player, self.POSITION_INCREMENT)
+            self.send_robot_command(move_robot, player, self.POSITION_INCREMENT)
             
-            print(f"[JUEGO] Jugador {player}: CORRECTO - Puntos: {player_state.score}")
+            log.debug("[JUEGO] Jugador %s: CORRECTO - Puntos: %s", player, player_state.score)
             
             if player_state.target_position >= self.WINNING_POSITION:
                 self.winner = player
                 self.phase = GamePhase.FINISHED
-                celebrate_robot(player)
-                print(f"[JUEGO] Jugador {player} GANA!")
+                self.send_robot_command(celebrate_robot, player)
+                log.info("[JUEGO] Jugador %s GANA!", player)
                 return
             
             self.phase = GamePhase.RESULT_PAUSE
@@ -796,24 +1193,25 @@ class RobotRaceGame:
         else:
             # ========== RESPUESTA INCORRECTA ==========
             player_state.blocked_this_round = True
-            player_state.message = f"Incorrecto! Bloqueado esta ronda"
+            self._blocked_mask |= 1 << (player - 1)
+            player_state.message = "Incorrecto! Bloqueado esta ronda"
             player_state.message_type = "error"
             player_state.last_answer = "incorrect"
             
-            print(f"[JUEGO] Jugador {player}: INCORRECTO - Bloqueado esta ronda")
+            log.debug("[JUEGO] Jugador %s: INCORRECTO - Bloqueado esta ronda", player)
             
-            if self.player1.blocked_this_round and self.player2.blocked_this_round:
+            if self._blocked_mask == self.ALL_BLOCKED_MASK:
                 self.last_answer_correct = False
                 self.round_winner = None
                 self.phase = GamePhase.RESULT_PAUSE
                 self.result_pause_start = pygame.time.get_ticks()
-                print("[JUEGO] Ambos jugadores fallaron - Siguiente pregunta")
+                log.debug("[JUEGO] Ambos jugadores fallaron - Siguiente pregunta")
     
-    def handle_timeout(self):
+    def handle_timeout(self) -> None:
         """
         Maneja el caso cuando se acaba el tiempo para responder.
         """
-        print("[JUEGO] Tiempo agotado - Pregunta invalidada!")
+        log.debug("[JUEGO] Tiempo agotado - Pregunta invalidada!")
         
         self.round_winner = None
         self.last_answer_correct = None
@@ -826,7 +1224,7 @@ class RobotRaceGame:
         self.phase = GamePhase.RESULT_PAUSE
         self.result_pause_start = pygame.time.get_ticks()
     
-    def determine_winner(self):
+    def determine_winner(self) -> None:
         """
         Determina el ganador cuando se acaban las preguntas.
         """
@@ -834,50 +1232,67 @@ class RobotRaceGame:
         
         if self.player1.score > self.player2.score:
             self.winner = 1
-            celebrate_robot(1)
-            print(f"[JUEGO] Jugador 1 GANA! ({self.player1.score} vs {self.player2.score})")
+            self.send_robot_command(celebrate_robot, 1)
+            log.info("[JUEGO] Jugador 1 GANA! (%s vs %s)", self.player1.score, self.player2.score)
         elif self.player2.score > self.player1.score:
             self.winner = 2
-            celebrate_robot(2)
-            print(f"[JUEGO] Jugador 2 GANA! ({self.player2.score} vs {self.player1.score})")
+            self.send_robot_command(celebrate_robot, 2)
+            log.info("[JUEGO] Jugador 2 GANA! (%s vs %s)", self.player2.score, self.player1.score)
         else:
             self.winner = 0
-            print(f"[JUEGO] EMPATE! ({self.player1.score} = {self.player2.score})")
+            log.info("[JUEGO] EMPATE! (%s = %s)", self.player1.score, self.player2.score)
     
-    def reset_game(self):
+    def reset_game(self) -> None:
         """
         Reinicia el juego al estado inicial (menu).
         Detiene todos los motores de ambos robots.
         """
-        # Detener todos los robots al reiniciar
-        stop_all_robots()
+        # Detener todos los robots al reiniciar (en el hilo EV3)
+        self.stop_robots_async()
         
         self.phase = GamePhase.MENU
         self.winner = None
         self.player1 = PlayerState()
         self.player2 = PlayerState()
+        self._blocked_mask = 0
         self.available_questions = []
+        self._q_cursor = 0
         self.current_question = None
         self.current_options = []
+        self._option_texts = []
+        self._q_lines = []
+        self._q_preview = None
+        self._q_correct = None
+        self._answers_layer = None
         self.questions_answered = 0
         self.countdown_number = 3
         self.question_time_remaining = QUESTION_TIME_LIMIT
+        self.invalidate_presented_frame()
         
-        print("[JUEGO] Juego reiniciado - Volviendo al menu")
+        log.info("[JUEGO] Juego reiniciado - Volviendo al menu")
     
     # ==========================================================================
     #                       ACTUALIZACION DEL JUEGO
     # ==========================================================================
     
-    def update(self):
+    def update(self) -> None:
         """
         Actualiza el estado del juego en cada frame.
         """
-        self.animation_time += 1
+        # A IDLE_FPS cada frame avanza varios pasos: la animacion no se ralentiza
+        steps = FPS // self.frame_rate()
+        self.animation_time += steps
+        self.update_animation()
+        
+        # Un solo reloj monotono (milisegundos) para todas las fases del frame
+        now_ms = pygame.time.get_ticks()
+        
+        # Solo una fase por frame: si cambia, la nueva se atiende en el siguiente
+        phase = self.phase
         
         # ========== MANEJAR FASE DE CUENTA REGRESIVA ==========
-        if self.phase == GamePhase.COUNTDOWN:
-            elapsed = time.time() - self.countdown_start_time
+        if phase == GamePhase.COUNTDOWN:
+            elapsed = now_ms - self.countdown_start_time
             
             if elapsed < COUNTDOWN_DURATION:
                 self.countdown_number = 3
@@ -889,123 +1304,214 @@ class RobotRaceGame:
                 self.start_question_phase()
         
         # ========== MANEJAR FASE DE PREGUNTA ==========
-        if self.phase == GamePhase.QUESTION:
-            elapsed = time.time() - self.question_start_time
-            self.question_time_remaining = max(0, QUESTION_TIME_LIMIT - int(elapsed))
+        elif phase == GamePhase.QUESTION:
+            # max() evita un frame con 31s si la fase arranco despues de now_ms
+            elapsed = max(0, now_ms - self.question_start_time)
+            self.question_time_remaining = max(0, QUESTION_TIME_LIMIT - elapsed // 1000)
             
             if self.question_time_remaining <= 0:
                 self.handle_timeout()
         
         # ========== MANEJAR PAUSA DE RESULTADO ==========
-        if self.phase == GamePhase.RESULT_PAUSE:
-            elapsed = pygame.time.get_ticks() - self.result_pause_start
+        elif phase == GamePhase.RESULT_PAUSE:
+            elapsed = now_ms - self.result_pause_start
             if elapsed >= RESULT_PAUSE_DURATION:
                 self.start_countdown_for_next_question()
         
         # ========== ANIMAR POSICIONES DE ROBOTS ==========
-        for player_state in [self.player1, self.player2]:
-            if player_state.position < player_state.target_position:
-                player_state.position += 2
-                if player_state.position > player_state.target_position:
-                    player_state.position = player_state.target_position
-            
-            player_state.animation_offset = math.sin(self.animation_time * 0.1) * 3
+        offset = self.anim_bob * 3
+        self.tick_player(self.player1, offset, steps)
+        self.tick_player(self.player2, offset, steps)
+    
+    def frame_rate(self) -> int:
+        """
+        Frames por segundo de la fase actual: IDLE_FPS en menu y fin de juego.
+        """
+        return IDLE_FPS if self.phase in IDLE_PHASES else FPS
+    
+    def update_animation(self) -> None:
+        """
+        Calcula una sola vez por frame los valores de animacion que
+        comparten update() y las funciones de dibujo.
+        """
+        self.anim_bob = self.anim_sin(0.1)                   # Balanceo de los robots
+        self.anim_pupil = self.anim_sin(0.05) * 2            # Desplazamiento de las pupilas
+        self.anim_pulse = 1.0 + self.anim_sin(0.3) * 0.1     # Pulso de la cuenta regresiva
+        self.anim_bounce = abs(self.anim_sin(0.2)) * 15      # Salto del robot que gana la ronda
+    
+    def anim_sin(self, speed: float) -> float:
+        """
+        Aproxima math.sin(self.animation_time * speed) leyendo la tabla
+        precalculada (speed debe ser multiplo de SIN_LUT_STEP).
+        """
+        return self._sin_lut[round(self.animation_time * speed / SIN_LUT_STEP) % SIN_LUT_SIZE]
+    
+    def tick_player(self, player_state: PlayerState, offset: float, steps: int = 1) -> None:
+        """
+        Avanza la posicion animada de un jugador hacia su objetivo.
+        """
+        if player_state.position < player_state.target_position:
+            player_state.position = min(player_state.position + 2 * steps, player_state.target_position)
+        
+        player_state.animation_offset = offset
     
     # ==========================================================================
     #                       MANEJO DE EVENTOS
     # ==========================================================================
   
-    def handle_events(self):
+    def handle_events(self) -> bool:
         """
         Procesa todos los eventos de entrada del usuario.
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        # Constantes y tabla de manejadores como locales del bucle de eventos
+        QUIT, KEYDOWN, K_ESCAPE = pygame.QUIT, pygame.KEYDOWN, pygame.K_ESCAPE
+        key_handlers = self._key_handlers
+        
+        for event in pygame.event.get(HANDLED_EVENTS):
+            if event.type == QUIT:
                 return False
             
-            if event.type == pygame.KEYDOWN:
+            # Otra ventana destapo parte del juego: el siguiente frame se
+            # dibuja y se envia completo
+            if event.type in EXPOSE_EVENTS:
+                self.invalidate_presented_frame()
+                continue
+            
+            if event.type == KEYDOWN:
+                key = event.key
                 
                 # 1. Gestion de la tecla ESC
-                if event.key == pygame.K_ESCAPE:
+                if key == K_ESCAPE:
                     if self.phase == GamePhase.MENU:
                         return False
                     else:
                         self.reset_game()
                 
-                # 2. Teclas solo en el MENU
-                if self.phase == GamePhase.MENU:
-                    if event.key == pygame.K_a or event.key == pygame.K_d:
-                        self.start_game(1)
-                    elif event.key == pygame.K_s or event.key == pygame.K_f:
-                        self.start_game(2)
-                    elif event.key == pygame.K_w or event.key == pygame.K_g:
-                        self.start_game(3)
-                
-                # 3. Teclas solo durante la PREGUNTA
-                elif self.phase == GamePhase.QUESTION:
-                    # Controles Jugador 1
-                    if event.key == pygame.K_a: self.answer_question(1, 0)
-                    elif event.key == pygame.K_s: self.answer_question(1, 1)
-                    elif event.key == pygame.K_w: self.answer_question(1, 2)
-                    
-                    # Controles Jugador 2
-                    elif event.key == pygame.K_d: self.answer_question(2, 0)
-                    elif event.key == pygame.K_f: self.answer_question(2, 1)
-                    elif event.key == pygame.K_g: self.answer_question(2, 2)
-                
-                # 4. Teclas en FIN DE JUEGO
-                elif self.phase == GamePhase.FINISHED:
-                    if event.key == pygame.K_SPACE:
-                        print("[JUEGO] Reiniciando al menu...")
-                        self.reset_game()
+                # 2. Teclas propias de la fase actual
+                handler = key_handlers.get(self.phase)
+                if handler is not None:
+                    handler(key)
         
         return True
     
+    def invalidate_presented_frame(self) -> None:
+        """
+        Olvida lo que hay en pantalla para que el siguiente frame se dibuje
+        (sin saltarse frames identicos) y se envie completo con flip().
+        """
+        self._presented_phase = None
+        self._menu_last_state = None
+        self._game_over_last_state = None
+    
+    def on_menu_key(self, key: int) -> None:
+        """
+        Teclas del MENU: seleccion de nivel.
+        """
+        level = self._menu_keys.get(key)
+        if level is not None:
+            self.start_game(level)
+    
+    def on_question_key(self, key: int) -> None:
+        """
+        Teclas durante la PREGUNTA: respuesta de cada jugador.
+        """
+        answer = self._question_keys.get(key)
+        if answer is not None:
+            self.answer_question(*answer)
+    
+    def on_finished_key(self, key: int) -> None:
+        """
+        Teclas en FIN DE JUEGO: ESPACIO vuelve al menu.
+        """
+        if key == pygame.K_SPACE:
+            log.debug("[JUEGO] Reiniciando al menu...")
+            self.reset_game()
+    
     # ==========================================================================
     #                    FUNCIONES DE DIBUJO (UTILIDADES)
     # ==========================================================================
     
+    def blit_batch(self, target: pygame.Surface, blits: BlitList) -> None:
+        """
+        Dibuja una lista de pares (superficie, destino) con una sola llamada.
+        """
+        if HAS_FBLITS:
+            target.fblits(blits)  # type: ignore[attr-defined]
+        else:
+            target.blits(blits, doreturn=False)
+    
+    def build_translucent_surface(self, size: Tuple[int, int], color: Color, alpha: int) -> pygame.Surface:
+        """
+        Crea una superficie de color solido con transparencia global, ya
+        convertida al formato de la pantalla para que el blit sea directo.
+        """
+        surface = pygame.Surface(size).convert()
+        surface.fill(color)
+        surface.set_alpha(alpha)
+        return surface
+    
     def draw_rounded_rect(self, surface, color, rect, radius, border=0, border_color=None):
-        pygame.draw.rect(surface, color, rect, border_radius=radius)
-        if border > 0 and border_color:
-            pygame.draw.rect(surface, border_color, rect, border, border_radius=radius)
+        """
+        Dibuja un rectangulo redondeado (con borde opcional) copiando una
+        pieza pre-renderizada por (ancho, alto, color, radio, borde).
+        """
+        if radius == 0 and not (border > 0 and border_color):
+            # Rectangulo recto y sin borde: relleno directo, sin pieza intermedia
+            surface.fill(color, rect)
+            return
+        
+        rect = pygame.Rect(rect)
+        surface.blit(self.get_rounded_tile(rect.size, color, radius, border, border_color), rect)
     
-    def draw_robot(self, x, y, size, color, offset=0):
+    def get_rounded_tile(self, size, color, radius, border=0, border_color=None) -> pygame.Surface:
         """
-        Dibuja un robot animado con indicadores de 2 motores.
+        Devuelve (creandola la primera vez) la pieza de un rectangulo
+        redondeado, para dibujarla directamente o dentro de un lote de blits.
         """
-        y += offset
+        key = (size[0], size[1], color, radius, border, border_color)
+        tile = self._rounded_rects.get(key)
+        if tile is None:
+            tile = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            tile_rect = tile.get_rect()
+            pygame.draw.rect(tile, color, tile_rect, border_radius=radius)
+            if border > 0 and border_color:
+                pygame.draw.rect(tile, border_color, tile_rect, border, border_radius=radius)
+            self._rounded_rects[key] = tile
+        return tile
+    
+    def build_robot_sprite(self, size: int, color: Color) -> pygame.Surface:
+        """
+        Pre-renderiza las partes fijas de un robot (cuerpo, ojos, boca, antena
+        y ruedas) centrado en (size, size) de una superficie de 2*size x 2*size.
+        Las pupilas se animan aparte en draw_robot().
+        """
+        surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA).convert_alpha()
+        x = y = size
         
         # ========== CUERPO ==========
         body = pygame.Rect(x - size//2, y - size//2, size, size)
-        self.draw_rounded_rect(self.screen, color, body, size//4)
-        pygame.draw.rect(self.screen, COLORS['text_white'], body, 2, border_radius=size//4)
+        self.draw_rounded_rect(surface, color, body, size//4)
+        pygame.draw.rect(surface, COLORS['text_white'], body, 2, border_radius=size//4)
         
         # ========== OJOS ==========
         eye_size = size // 5
         eye_y = y - size//6
         
-        pygame.draw.circle(self.screen, COLORS['background'], 
-                          (x - size//4, int(eye_y)), eye_size)
-        pygame.draw.circle(self.screen, COLORS['background'], 
-                          (x + size//4, int(eye_y)), eye_size)
-        
-        pupil_offset = math.sin(self.animation_time * 0.05) * 2
-        pygame.draw.circle(self.screen, COLORS['text_white'], 
-                          (int(x - size//4 + pupil_offset), int(eye_y)), eye_size//2)
-        pygame.draw.circle(self.screen, COLORS['text_white'], 
-                          (int(x + size//4 + pupil_offset), int(eye_y)), eye_size//2)
+        pygame.draw.circle(surface, COLORS['background'], 
+                          (x - size//4, eye_y), eye_size)
+        pygame.draw.circle(surface, COLORS['background'], 
+                          (x + size//4, eye_y), eye_size)
         
         # ========== BOCA ==========
         mouth_rect = pygame.Rect(x - size//3, y + size//6, size//1.5, size//6)
-        pygame.draw.rect(self.screen, COLORS['background'], mouth_rect, border_radius=3)
+        pygame.draw.rect(surface, COLORS['background'], mouth_rect, border_radius=3)
         
         # ========== ANTENA ==========
-        pygame.draw.line(self.screen, color, 
+        pygame.draw.line(surface, color, 
                         (x, y - size//2), 
                         (x, y - size//2 - size//4), 3)
-        pygame.draw.circle(self.screen, COLORS['accent'], 
-                          (x, int(y - size//2 - size//4)), 5)
+        pygame.draw.circle(surface, COLORS['accent'], 
+                          (x, y - size//2 - size//4), 5)
         
         # ========== INDICADORES DE RUEDAS (2 MOTORES) ==========
         # Solo dibujar para robots de tamano >= 50 (no en los pequenitos de pista)
@@ -1013,35 +1519,80 @@ class RobotRaceGame:
             wheel_size = size // 6
             # Rueda izquierda
             wheel_l = pygame.Rect(x - size//2 - wheel_size//2, y + size//4, wheel_size, wheel_size * 2)
-            pygame.draw.rect(self.screen, COLORS['text_gray'], wheel_l, border_radius=3)
-            pygame.draw.rect(self.screen, COLORS['text_white'], wheel_l, 1, border_radius=3)
+            pygame.draw.rect(surface, COLORS['text_gray'], wheel_l, border_radius=3)
+            pygame.draw.rect(surface, COLORS['text_white'], wheel_l, 1, border_radius=3)
             # Rueda derecha
             wheel_r = pygame.Rect(x + size//2 - wheel_size//2, y + size//4, wheel_size, wheel_size * 2)
-            pygame.draw.rect(self.screen, COLORS['text_gray'], wheel_r, border_radius=3)
-            pygame.draw.rect(self.screen, COLORS['text_white'], wheel_r, 1, border_radius=3)
+            pygame.draw.rect(surface, COLORS['text_gray'], wheel_r, border_radius=3)
+            pygame.draw.rect(surface, COLORS['text_white'], wheel_r, 1, border_radius=3)
+        
+        return surface
+    
+    def build_robot_frame(self, size: int, color: Color, pupil_px: int) -> pygame.Surface:
+        """
+        Compone un robot completo (sprite fijo + pupilas desplazadas pupil_px
+        pixeles) listo para dibujarse con un solo blit.
+        """
+        sprite = self._robot_sprites.get((size, color))
+        if sprite is None:
+            sprite = self.build_robot_sprite(size, color)
+            self._robot_sprites[(size, color)] = sprite
+        frame = sprite.copy()
+        
+        # ========== PUPILAS ==========
+        radius = size // 5 // 2
+        pupil = self._pupil_sprites.get(radius)
+        if pupil is None:
+            # Circulo centrado en (radius + 1, radius + 1) de un cuadro de 2*radius + 2
+            pupil = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(pupil, COLORS['text_white'], (radius + 1, radius + 1), radius)
+            self._pupil_sprites[radius] = pupil
+        
+        # El robot esta centrado en (size, size) dentro del sprite
+        eye_top = size - size//6 - radius - 1
+        frame.blit(pupil, (size - size//4 + pupil_px - radius - 1, eye_top))
+        frame.blit(pupil, (size + size//4 + pupil_px - radius - 1, eye_top))
+        return frame
+    
+    def draw_robot(self, x: int, y: int, size: int, color: Color, offset: int = 0) -> None:
+        """
+        Dibuja un robot animado con indicadores de 2 motores.
+        """
+        y += offset
+        
+        # Las pupilas solo ocupan unas pocas posiciones enteras: un cuadro por cada una
+        pupil_px = math.floor(self.anim_pupil)
+        key = (size, color, pupil_px)
+        frame = self._robot_frames.get(key)
+        if frame is None:
+            frame = self.build_robot_frame(size, color, pupil_px)
+            self._robot_frames[key] = frame
+        self.screen.blit(frame, (x - size, y - size))
     
     # ==========================================================================
     #                         DIBUJAR MENU
     # ==========================================================================
     
-    def draw_menu(self):
+    def build_menu_static(self) -> pygame.Surface:
         """
-        Dibuja la pantalla del menu principal con informacion de conexion EV3.
+        Compone una sola vez todo el contenido fijo del menu (logos, titulo,
+        paneles de instrucciones y controles, creditos) sobre una superficie
+        transparente.
         """
-        self.screen.fill(COLORS['background'])
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
         
         # ========== LOGOS INSTITUCIONALES ==========
         if self.logo_fac:
-            self.screen.blit(self.logo_fac, (20, 10))
+            surface.blit(self.logo_fac, (20, 10))
         
         if self.logo_ingeniotics:
-            self.screen.blit(self.logo_ingeniotics, (SCREEN_WIDTH - 170, 25))
+            surface.blit(self.logo_ingeniotics, (SCREEN_WIDTH - 170, 25))
         
         # ========== TITULO ==========
         title_text = "ROBOT RACE QUIZ"
         title = self.font_title.render(title_text, True, COLORS['text_white'])
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
         
         # ========== SUBTITULO ==========
         subtitle = self.font_small.render(
@@ -1049,46 +1600,15 @@ class RobotRaceGame:
             True, COLORS['accent']
         )
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 120))
-        self.screen.blit(subtitle, subtitle_rect)
-        
-        # ========== ROBOTS DECORATIVOS ANIMADOS (con 2 ruedas cada uno) ==========
-        self.draw_robot(150, 200, 70, COLORS['player1'], self.player1.animation_offset)
-        self.draw_robot(SCREEN_WIDTH - 150, 200, 70, COLORS['player2'], 
-                       -math.sin(self.animation_time * 0.1) * 3)
-        
-        # ========== ESTADO DE CONEXION EV3 (BLUETOOTH) ==========
-        ev3_panel_rect = pygame.Rect(SCREEN_WIDTH // 2 - 380, 148, 760, 40)
-        self.draw_rounded_rect(self.screen, COLORS['card'], ev3_panel_rect, 8, 2, COLORS['bluetooth'])
-        
-        # Icono/texto de Bluetooth
-        bt_label = self.font_tiny.render("BLUETOOTH EV3:", True, COLORS['bluetooth'])
-        self.screen.blit(bt_label, (SCREEN_WIDTH // 2 - 365, 155))
-        
-        # Estado Robot 1
-        r1_status = "CONECTADO (2 motores)" if ROBOT1_CONNECTED else "SIMULADO"
-        r1_color = COLORS['success'] if ROBOT1_CONNECTED else COLORS['accent']
-        r1_text = self.font_tiny.render(f"Robot 1 (J1): {r1_status}", True, r1_color)
-        self.screen.blit(r1_text, (SCREEN_WIDTH // 2 - 200, 155))
-        
-        # Estado Robot 2
-        r2_status = "CONECTADO (2 motores)" if ROBOT2_CONNECTED else "SIMULADO"
-        r2_color = COLORS['success'] if ROBOT2_CONNECTED else COLORS['accent']
-        r2_text = self.font_tiny.render(f"Robot 2 (J2): {r2_status}", True, r2_color)
-        self.screen.blit(r2_text, (SCREEN_WIDTH // 2 + 100, 155))
-        
-        # Total motores
-        total_motors = (2 if ROBOT1_CONNECTED else 0) + (2 if ROBOT2_CONNECTED else 0)
-        motors_text = self.font_tiny.render(f"[{total_motors}/4 motores]", True, COLORS['text_muted'])
-        motors_rect = motors_text.get_rect(right=SCREEN_WIDTH // 2 + 370, centery=ev3_panel_rect.centery)
-        self.screen.blit(motors_text, motors_rect)
+        surface.blit(subtitle, subtitle_rect)
         
         # ========== PANEL DE INSTRUCCIONES ==========
         instr_rect = pygame.Rect(SCREEN_WIDTH // 2 - 380, 195, 760, 100)
-        self.draw_rounded_rect(self.screen, COLORS['card'], instr_rect, 12, 2, COLORS['question'])
+        self.draw_rounded_rect(surface, COLORS['card'], instr_rect, 12, 2, COLORS['question'])
         
         flow_title = self.font_medium.render("FLUJO DEL JUEGO", True, COLORS['question'])
         flow_title_rect = flow_title.get_rect(center=(SCREEN_WIDTH // 2, 215))
-        self.screen.blit(flow_title, flow_title_rect)
+        surface.blit(flow_title, flow_title_rect)
         
         flow1 = self.font_tiny.render(
             "1. INTERLUDIO: Cuenta regresiva 3, 2, 1...", 
@@ -1102,44 +1622,18 @@ class RobotRaceGame:
             "3. El primero en responder CORRECTAMENTE avanza con su robot EV3!", 
             True, COLORS['text_gray']
         )
-        self.screen.blit(flow1, (SCREEN_WIDTH // 2 - 360, 235))
-        self.screen.blit(flow2, (SCREEN_WIDTH // 2 - 360, 253))
-        self.screen.blit(flow3, (SCREEN_WIDTH // 2 - 360, 271))
+        surface.blit(flow1, (SCREEN_WIDTH // 2 - 360, 235))
+        surface.blit(flow2, (SCREEN_WIDTH // 2 - 360, 253))
+        surface.blit(flow3, (SCREEN_WIDTH // 2 - 360, 271))
         
         # ========== CONTROLES ==========
         ctrl_rect = pygame.Rect(SCREEN_WIDTH // 2 - 380, 305, 760, 50)
-        self.draw_rounded_rect(self.screen, COLORS['card'], ctrl_rect, 8, 1, COLORS['border'])
+        self.draw_rounded_rect(surface, COLORS['card'], ctrl_rect, 8, 1, COLORS['border'])
         
         ctrl_text1 = self.font_tiny.render("J1 (Verde) Robot 1: Boton Azul / Rojo / Verde", True, COLORS['player1'])
         ctrl_text2 = self.font_tiny.render("J2 (Naranja) Robot 2: Boton Azul / Rojo / Verde", True, COLORS['player2'])
-        self.screen.blit(ctrl_text1, (SCREEN_WIDTH // 2 - 360, 317))
-        self.screen.blit(ctrl_text2, (SCREEN_WIDTH // 2 + 20, 317))
-        
-        # ========== BOTONES DE NIVEL ==========
-        levels = [
-            ("Azul", "Facil", "Preguntas basicas de matematicas", COLORS['player1']),
-            ("Rojo", "Medio", "Conocimiento general y operaciones", COLORS['accent']),
-            ("Verde", "Dificil", "Matematicas avanzadas", COLORS['player2']),
-        ]
-        
-        y_start = 370
-        for i, (btn_name, name, desc, color) in enumerate(levels):
-            btn_rect = pygame.Rect(SCREEN_WIDTH // 2 - 220, y_start + i * 95, 440, 80)
-            
-            mouse_pos = pygame.mouse.get_pos()
-            is_hover = btn_rect.collidepoint(mouse_pos)
-            
-            bg_color = color if is_hover else COLORS['card']
-            text_color = COLORS['background'] if is_hover else COLORS['text_white']
-            
-            self.draw_rounded_rect(self.screen, bg_color, btn_rect, 12, 2, color)
-            
-            level_text = self.font_medium.render(f"Nivel {i+1}: {name}", True, text_color)
-            self.screen.blit(level_text, (btn_rect.x + 20, btn_rect.y + 15))
-            
-            key_text = self.font_small.render(f"Presiona Boton {btn_name}", True, text_color)
-            key_rect = key_text.get_rect(right=btn_rect.right - 20, centery=btn_rect.centery)
-            self.screen.blit(key_text, key_rect)
+        surface.blit(ctrl_text1, (SCREEN_WIDTH // 2 - 360, 317))
+        surface.blit(ctrl_text2, (SCREEN_WIDTH // 2 + 20, 317))
         
         # ========== TEXTO DE COMPATIBILIDAD ==========
         comp_text = self.font_tiny.render(
@@ -1147,14 +1641,133 @@ class RobotRaceGame:
             True, COLORS['text_muted']
         )
         comp_rect = comp_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
-        self.screen.blit(comp_text, comp_rect)
+        surface.blit(comp_text, comp_rect)
         
         credit_text = self.font_tiny.render(
             "Facultad de Matematicas | Ingeniotics", 
             True, COLORS['text_muted']
         )
         credit_rect = credit_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20))
-        self.screen.blit(credit_text, credit_rect)
+        surface.blit(credit_text, credit_rect)
+        
+        return surface
+    
+    def build_ev3_panel(self) -> pygame.Surface:
+        """
+        Pre-renderiza el panel de conexion EV3 del menu. El estado de los
+        robots se decide al arrancar y no cambia durante el juego.
+        """
+        surface = pygame.Surface((760, 40), pygame.SRCALPHA).convert_alpha()
+        panel_rect = surface.get_rect()
+        self.draw_rounded_rect(surface, COLORS['card'], panel_rect, 8, 2, COLORS['bluetooth'])
+        
+        # Icono/texto de Bluetooth
+        bt_label = self.font_tiny.render("BLUETOOTH EV3:", True, COLORS['bluetooth'])
+        surface.blit(bt_label, (15, 7))
+        
+        status = self.ev3_status
+        
+        # Estado Robot 1
+        r1_status = "CONECTADO (2 motores)" if status['robot1_connected'] else "SIMULADO"
+        r1_color = COLORS['success'] if status['robot1_connected'] else COLORS['accent']
+        r1_text = self.font_tiny.render(f"Robot 1 (J1): {r1_status}", True, r1_color)
+        surface.blit(r1_text, (180, 7))
+        
+        # Estado Robot 2
+        r2_status = "CONECTADO (2 motores)" if status['robot2_connected'] else "SIMULADO"
+        r2_color = COLORS['success'] if status['robot2_connected'] else COLORS['accent']
+        r2_text = self.font_tiny.render(f"Robot 2 (J2): {r2_status}", True, r2_color)
+        surface.blit(r2_text, (480, 7))
+        
+        # Total motores
+        motors_text = self.font_tiny.render(f"[{status['total_motors']}/4 motores]", True, COLORS['text_muted'])
+        surface.blit(motors_text, motors_text.get_rect(right=750, centery=panel_rect.centery))
+        
+        return surface
+    
+    def build_level_buttons(self) -> Dict[Tuple[int, bool], pygame.Surface]:
+        """
+        Pre-renderiza los 3 botones de nivel en sus dos estados (normal y con
+        el cursor encima). Retorna {(indice_nivel, hover): Surface}.
+        """
+        buttons = {}
+        for i, (btn_name, name, desc, color) in enumerate(MENU_LEVELS):
+            for is_hover in (False, True):
+                surface = pygame.Surface((self.LEVEL_BTN_WIDTH, self.LEVEL_BTN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+                btn_rect = surface.get_rect()
+                
+                bg_color = color if is_hover else COLORS['card']
+                text_color = COLORS['background'] if is_hover else COLORS['text_white']
+                
+                self.draw_rounded_rect(surface, bg_color, btn_rect, 12, 2, color)
+                
+                level_text = self.font_medium.render(f"Nivel {i+1}: {name}", True, text_color)
+                surface.blit(level_text, (btn_rect.x + 20, btn_rect.y + 15))
+                
+                key_text = self.font_small.render(f"Presiona Boton {btn_name}", True, text_color)
+                key_rect = key_text.get_rect(right=btn_rect.right - 20, centery=btn_rect.centery)
+                surface.blit(key_text, key_rect)
+                
+                buttons[(i, is_hover)] = surface
+        
+        return buttons
+    
+    def draw_menu(self) -> bool:
+        """
+        Dibuja la pantalla del menu principal con informacion de conexion EV3.
+        Retorna False si el frame seria identico al anterior y no se dibujo.
+        """
+        blits: BlitList = []
+        
+        # ========== ESTADO VISIBLE DEL FRAME ==========
+        # Solo cambian la altura de los robots, sus pupilas y el boton bajo el cursor
+        btn_step = self.LEVEL_BTN_STEP
+        
+        # Boton bajo el cursor calculado una sola vez (-1 = ninguno)
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        rel_x = mouse_x - self.LEVEL_BTN_X
+        rel_y = mouse_y - self.LEVEL_BTN_Y
+        hover_index = -1
+        if (0 <= rel_x < self.LEVEL_BTN_WIDTH and 0 <= rel_y < 3 * btn_step
+                and rel_y % btn_step < self.LEVEL_BTN_HEIGHT):
+            hover_index = rel_y // btn_step
+        
+        robot1_y = int(200 + self.player1.animation_offset)
+        robot2_y = int(200 - self.anim_bob * 3)
+        pupil_px = math.floor(self.anim_pupil)
+        
+        state = (hover_index, robot1_y, robot2_y, pupil_px)
+        if state == self._menu_last_state:
+            return False
+        self._menu_last_state = state
+        
+        if self._menu_static is None:
+            self._menu_static = self.build_menu_static()
+        
+        self.screen.fill(COLORS['background'])
+        
+        # ========== ROBOTS DECORATIVOS ANIMADOS (con 2 ruedas cada uno) ==========
+        self.draw_robot(150, robot1_y, 70, COLORS['player1'])
+        self.draw_robot(SCREEN_WIDTH - 150, robot2_y, 70, COLORS['player2'])
+        
+        # ========== ESTADO DE CONEXION EV3 (BLUETOOTH, PRE-COMPUESTO) ==========
+        if self._ev3_panel is None:
+            self._ev3_panel = self.build_ev3_panel()
+        blits.append((self._ev3_panel, (SCREEN_CENTER_X - 380, 148)))
+        
+        # ========== TITULO, INSTRUCCIONES, CONTROLES Y CREDITOS (PRE-COMPUESTOS) ==========
+        blits.append((self._menu_static, (0, 0)))
+        
+        # ========== BOTONES DE NIVEL ==========
+        if not self._level_buttons:
+            self._level_buttons = self.build_level_buttons()
+        
+        level_buttons = self._level_buttons
+        for i, btn_pos in enumerate(self._level_btn_pos):
+            blits.append((level_buttons[(i, i == hover_index)], btn_pos))
+        
+        self.blit_batch(self.screen, blits)
+        return True
     
     # ==========================================================================
     #                   DIBUJAR PISTA DE CARRERAS
@@ -1164,9 +1777,7 @@ class RobotRaceGame:
         """
         Dibuja la pista de carreras con barras de progreso segmentadas.
         """
-        track_title = self.font_medium.render("PISTA DE CARRERA", True, COLORS['text_white'])
-        track_title_rect = track_title.get_rect(center=(SCREEN_WIDTH // 2, 85))
-        self.screen.blit(track_title, track_title_rect)
+        self.blit_centered(self.font_medium, "PISTA DE CARRERA", COLORS['text_white'], (SCREEN_CENTER_X, 85))
         
         track_x = 80
         track_width = SCREEN_WIDTH - 200
@@ -1192,48 +1803,81 @@ class RobotRaceGame:
         # ========== LINEA DE META ==========
         finish_x = track_x + track_width + 20
         meta_rect = pygame.Rect(finish_x, track_y_1 - 10, 12, track_y_2 + track_height - track_y_1 + 20)
-        pygame.draw.rect(self.screen, COLORS['finish'], meta_rect, border_radius=4)
+        self.draw_rounded_rect(self.screen, COLORS['finish'], meta_rect, 4)
         
-        meta_text = self.font_medium.render("META", True, COLORS['finish'])
+        meta_text = self._get_text(self.font_medium, "META", COLORS['finish'])
         meta_text_rect = meta_text.get_rect(left=finish_x + 20, centery=(track_y_1 + track_y_2 + track_height) // 2)
         self.screen.blit(meta_text, meta_text_rect)
     
-    def draw_player_track(self, x, y, width, height, segments, gap, player_state, player_num, color):
+    def get_segment_tile(self, size: Tuple[int, int], color: Color) -> pygame.Surface:
+        """
+        Retorna un segmento redondeado del carril pre-renderizado en el color
+        indicado (se rasteriza una sola vez por tamano y color).
+        """
+        tile = self._segment_tiles.get((size, color))
+        if tile is None:
+            tile = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(tile, color, tile.get_rect(), border_radius=4)
+            self._segment_tiles[(size, color)] = tile
+        return tile
+    
+    def build_track_layer(self, width: int, height: int, segments: int, gap: int) -> Tuple[pygame.Surface, List[pygame.Rect]]:
+        """
+        Pre-renderiza el carril vacio (fondo, borde y todos los segmentos en
+        gris) y retorna (superficie, rects de los segmentos relativos al carril).
+        """
+        surface = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        self.draw_rounded_rect(surface, COLORS['track_bg'], surface.get_rect(), height // 2, 2, COLORS['border'])
+        
+        segment_width = (width - gap * (segments + 1)) / segments
+        seg_rects = [
+            pygame.Rect(gap + i * (segment_width + gap), 4, segment_width, height - 8)
+            for i in range(segments)
+        ]
+        seg_off = self.get_segment_tile(seg_rects[0].size, COLORS['track_segment'])
+        for seg_rect in seg_rects:
+            surface.blit(seg_off, seg_rect)
+        
+        return surface, seg_rects
+    
+    def draw_player_track(self, x: int, y: int, width: int, height: int, segments: int, gap: int,
+                          player_state: PlayerState, player_num: int, color: Color) -> None:
         """
         Dibuja el carril de progreso de un jugador con segmentos.
         Incluye indicador de robot EV3 y sus 2 motores.
         """
+        blits: BlitList = []
+        
         # ========== ETIQUETA DE JUGADOR CON INDICADOR EV3 ==========
-        is_connected = ROBOT1_CONNECTED if player_num == 1 else ROBOT2_CONNECTED
+        is_connected = self.ev3_status['robot1_connected' if player_num == 1 else 'robot2_connected']
         ev3_indicator = " [EV3]" if is_connected else " [SIM]"
         label_color = color
-        label_text = self.font_small.render(f"Jugador {player_num}{ev3_indicator}", True, label_color)
-        self.screen.blit(label_text, (x - 5, y - 22))
+        label_text = self._get_text(self.font_small, f"Jugador {player_num}{ev3_indicator}", label_color)
+        blits.append((label_text, (x - 5, y - 22)))
         
         # Indicador de estado de conexion (punto verde/rojo)
         indicator_x = x + label_text.get_width() + 5
         indicator_color = COLORS['success'] if is_connected else COLORS['error']
         pygame.draw.circle(self.screen, indicator_color, (indicator_x, y - 12), 5)
         
-        # ========== FONDO DEL CARRIL ==========
-        track_rect = pygame.Rect(x, y, width, height)
-        self.draw_rounded_rect(self.screen, COLORS['track_bg'], track_rect, height // 2, 2, COLORS['border'])
-        
-        # ========== CALCULAR SEGMENTOS ==========
-        segment_width = (width - gap * (segments + 1)) / segments
+        # ========== FONDO DEL CARRIL CON SEGMENTOS GRISES ==========
+        geometry = (x, y, width, height, segments, gap)
+        layer = self._track_layers.get(geometry)
+        if layer is None:
+            track_surface, seg_rects = self.build_track_layer(width, height, segments, gap)
+            # Posiciones en pantalla calculadas una sola vez por carril
+            layer = (track_surface, seg_rects[0].size, [(x + seg_rect.x, y + seg_rect.y) for seg_rect in seg_rects])
+            self._track_layers[geometry] = layer
+        track_surface, seg_size, seg_positions = layer
         progress_segments = int((player_state.position / 100) * segments)
         
         # ========== DIBUJAR SEGMENTOS ==========
-        for i in range(segments):
-            seg_x = x + gap + i * (segment_width + gap)
-            seg_rect = pygame.Rect(seg_x, y + 4, segment_width, height - 8)
-            
-            if i < progress_segments:
-                seg_color = color
-            else:
-                seg_color = COLORS['track_segment']
-            
-            pygame.draw.rect(self.screen, seg_color, seg_rect, border_radius=4)
+        # Solo los segmentos ya recorridos se pintan sobre el fondo; se
+        # despachan en un solo lote antes que el robot, que va encima
+        seg_on = self.get_segment_tile(seg_size, color)
+        track_blits = [(track_surface, (x, y))]
+        track_blits += [(seg_on, pos) for pos in seg_positions[:progress_segments]]
+        self.blit_batch(self.screen, track_blits)
         
         # ========== ROBOT EN LA PISTA ==========
         robot_progress_x = x + 30 + (width - 60) * (player_state.position / 100)
@@ -1241,9 +1885,11 @@ class RobotRaceGame:
         self.draw_robot(int(robot_progress_x), robot_y, 30, color, int(player_state.animation_offset * 0.5))
         
         # ========== PORCENTAJE ==========
-        percent_text = self.font_small.render(f"{int(player_state.position)}%", True, COLORS['text_white'])
+        percent_text = self._get_text(self.font_small, f"{int(player_state.position)}%", COLORS['text_white'])
         percent_rect = percent_text.get_rect(left=x + width + 10, centery=y + height // 2)
-        self.screen.blit(percent_text, percent_rect)
+        blits.append((percent_text, percent_rect))
+        
+        self.blit_batch(self.screen, blits)
     
     # ==========================================================================
     #                   DIBUJAR INTERFAZ UNICA DE JUEGO
@@ -1271,48 +1917,49 @@ class RobotRaceGame:
         """
         Dibuja el header del juego con titulo, nivel, puntuaciones e info EV3.
         """
-        header_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 60)
-        self.draw_rounded_rect(self.screen, COLORS['card'], header_rect, 0)
+        blits: BlitList = []
+        
+        self.draw_rounded_rect(self.screen, COLORS['card'], self._header_rect, 0)
         pygame.draw.line(self.screen, COLORS['border'], (0, 60), (SCREEN_WIDTH, 60), 2)
         
-        # Titulo
-        title = self.font_medium.render("ROBOT RACE QUIZ", True, COLORS['text_white'])
-        self.screen.blit(title, (20, 18))
+        # Titulo (el badge de nivel va despues en el lote: se dibuja encima de su final)
+        title = self._get_text(self.font_medium, "ROBOT RACE QUIZ", COLORS['text_white'])
+        blits.append((title, (20, 18)))
         
         # Badge de nivel
-        level_rect = pygame.Rect(200, 15, 80, 30)
-        self.draw_rounded_rect(self.screen, COLORS['accent'], level_rect, 8)
-        level_text = self.font_tiny.render(f"Nivel {self.level}", True, COLORS['background'])
-        level_text_rect = level_text.get_rect(center=level_rect.center)
-        self.screen.blit(level_text, level_text_rect)
+        level_rect = self._level_badge_rect
+        blits.append((self.get_rounded_tile(level_rect.size, COLORS['accent'], 8), level_rect))
+        blits.append(self._get_text_centered(self.font_tiny, f"Nivel {self.level}", COLORS['background'], level_rect.center))
         
         # Puntuaciones con indicador EV3
         p1_label = "J1"
         p2_label = "J2"
-        if ROBOT1_CONNECTED:
+        if self.ev3_status['robot1_connected']:
             p1_label += "[EV3]"
-        if ROBOT2_CONNECTED:
+        if self.ev3_status['robot2_connected']:
             p2_label += "[EV3]"
         
-        p1_score = self.font_small.render(f"{p1_label}: {self.player1.score}", True, COLORS['player1'])
-        p2_score = self.font_small.render(f"{p2_label}: {self.player2.score}", True, COLORS['player2'])
-        self.screen.blit(p1_score, (SCREEN_WIDTH // 2 - 120, 18))
-        self.screen.blit(p2_score, (SCREEN_WIDTH // 2 + 30, 18))
+        p1_score = self._get_text(self.font_small, f"{p1_label}: {self.player1.score}", COLORS['player1'])
+        p2_score = self._get_text(self.font_small, f"{p2_label}: {self.player2.score}", COLORS['player2'])
+        blits.append((p1_score, (SCREEN_CENTER_X - 120, 18)))
+        blits.append((p2_score, (SCREEN_CENTER_X + 30, 18)))
         
         # Numero de pregunta
-        q_text = self.font_tiny.render(f"Pregunta {self.questions_answered}", True, COLORS['text_gray'])
+        q_text = self._get_text(self.font_tiny, f"Pregunta {self.questions_answered}", COLORS['text_gray'])
         q_rect = q_text.get_rect(right=SCREEN_WIDTH - 120, centery=30)
-        self.screen.blit(q_text, q_rect)
+        blits.append((q_text, q_rect))
         
         # Boton de salir
-        exit_text = self.font_tiny.render("ESC: Salir", True, COLORS['text_muted'])
-        self.screen.blit(exit_text, (SCREEN_WIDTH - 80, 22))
+        exit_text = self._get_text(self.font_tiny, "ESC: Salir", COLORS['text_muted'])
+        blits.append((exit_text, (SCREEN_WIDTH - 80, 22)))
+        
+        self.blit_batch(self.screen, blits)
     
     def draw_footer(self):
         """
         Dibuja el footer con informacion de controles y estado EV3.
         """
-        footer_rect = pygame.Rect(40, SCREEN_HEIGHT - 45, SCREEN_WIDTH - 80, 35)
+        footer_rect = self._footer_rect
         self.draw_rounded_rect(self.screen, COLORS['card'], footer_rect, 8, 1, COLORS['border'])
         
         if self.phase == GamePhase.COUNTDOWN:
@@ -1322,46 +1969,43 @@ class RobotRaceGame:
         else:
             text = "Esperando..."
         
-        ctrl_text = self.font_tiny.render(text, True, COLORS['text_muted'])
-        ctrl_rect = ctrl_text.get_rect(center=footer_rect.center)
-        self.screen.blit(ctrl_text, ctrl_rect)
+        self.blit_centered(self.font_tiny, text, COLORS['text_muted'], footer_rect.center)
+    
+    def build_countdown_circle(self, radius: int) -> pygame.Surface:
+        """
+        Pre-renderiza el circulo de la cuenta regresiva (relleno y borde
+        blanco) para un radio; el pulso solo recorre unos 20 radios enteros.
+        """
+        surface = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA).convert_alpha()
+        center = (radius + 1, radius + 1)
+        pygame.draw.circle(surface, COLORS['countdown'], center, radius)
+        pygame.draw.circle(surface, COLORS['text_white'], center, radius, 4)
+        return surface
     
     def draw_countdown_phase(self):
         """
         Dibuja la fase de cuenta regresiva "3, 2, 1".
         """
-        pulse = 1.0 + math.sin(self.animation_time * 0.3) * 0.1
+        pulse = self.anim_pulse
         center_y = 400
         
         radius = int(100 * pulse)
-        pygame.draw.circle(self.screen, COLORS['countdown'], 
-                          (SCREEN_WIDTH // 2, center_y), radius)
-        pygame.draw.circle(self.screen, COLORS['text_white'], 
-                          (SCREEN_WIDTH // 2, center_y), radius, 4)
-        
-        number_text = self.font_countdown.render(str(self.countdown_number), True, COLORS['text_white'])
-        number_rect = number_text.get_rect(center=(SCREEN_WIDTH // 2, center_y))
-        self.screen.blit(number_text, number_rect)
-        
-        prep_text = self.font_large.render("PREPARATE!", True, COLORS['accent'])
-        prep_rect = prep_text.get_rect(center=(SCREEN_WIDTH // 2, 270))
-        self.screen.blit(prep_text, prep_rect)
-        
-        if self.current_question:
-            preview_rect = pygame.Rect(100, 520, SCREEN_WIDTH - 200, 80)
-            preview_surface = pygame.Surface((preview_rect.width, preview_rect.height))
-            preview_surface.fill(COLORS['card'])
-            preview_surface.set_alpha(150)
-            self.screen.blit(preview_surface, preview_rect)
+        circle = self._countdown_circles.get(radius)
+        if circle is None:
+            circle = self.build_countdown_circle(radius)
+            self._countdown_circles[radius] = circle
+        self.screen.blit(circle, (SCREEN_CENTER_X - radius - 1, center_y - radius - 1))
+        
+        self.blit_centered(self.font_countdown, str(self.countdown_number), COLORS['text_white'], (SCREEN_CENTER_X, center_y))
+        
+        self.blit_centered(self.font_large, "PREPARATE!", COLORS['accent'], (SCREEN_CENTER_X, 270))
+        
+        if self._q_preview:
+            self.screen.blit(self._preview_panel, self._preview_rect)
             
-            next_label = self.font_tiny.render("SIGUIENTE PREGUNTA:", True, COLORS['text_muted'])
-            next_label_rect = next_label.get_rect(center=(SCREEN_WIDTH // 2, 545))
-            self.screen.blit(next_label, next_label_rect)
+            self.blit_centered(self.font_tiny, "SIGUIENTE PREGUNTA:", COLORS['text_muted'], (SCREEN_CENTER_X, 545))
             
-            q_preview = self.current_question.pregunta[:60] + "..." if len(self.current_question.pregunta) > 60 else self.current_question.pregunta
-            q_text = self.font_small.render(q_preview, True, COLORS['text_gray'])
-            q_rect = q_text.get_rect(center=(SCREEN_WIDTH // 2, 575))
-            self.screen.blit(q_text, q_rect)
+            self.screen.blit(*self._q_preview)
     
     def draw_question_phase(self):
         """
@@ -1371,33 +2015,40 @@ class RobotRaceGame:
         time_percent = self.question_time_remaining / QUESTION_TIME_LIMIT
         is_low_time = self.question_time_remaining <= 10
         
-        timer_panel = pygame.Rect(SCREEN_WIDTH // 2 - 150, 230, 300, 50)
+        # Panel, texto y barra en orden de pintado, despachados en un solo lote
+        blits: BlitList = []
+        
+        timer_panel = self._timer_panel_rect
         timer_color = COLORS['error'] if is_low_time else COLORS['question']
-        self.draw_rounded_rect(self.screen, timer_color, timer_panel, 12, 3, COLORS['text_white'])
+        blits.append((self.get_rounded_tile(timer_panel.size, timer_color, 12, 3, COLORS['text_white']), timer_panel))
         
         time_str = f"TIEMPO: {self.question_time_remaining}s"
-        time_text = self.font_large.render(time_str, True, COLORS['text_white'])
-        time_rect = time_text.get_rect(center=timer_panel.center)
-        self.screen.blit(time_text, time_rect)
+        blits.append(self._get_text_centered(self.font_large, time_str, COLORS['text_white'], timer_panel.center))
         
         # ========== BARRA DE TIEMPO ==========
-        timer_bg_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, 290, 400, 15)
+        timer_bg_rect = self._timer_bg_rect
         timer_fg_width = int(400 * time_percent)
-        timer_fg_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, 290, timer_fg_width, 15)
         
-        self.draw_rounded_rect(self.screen, COLORS['border'], timer_bg_rect, 6)
+        blits.append((self.get_rounded_tile(timer_bg_rect.size, COLORS['border'], 6), timer_bg_rect))
         if time_percent > 0:
             bar_color = COLORS['error'] if is_low_time else COLORS['question']
-            self.draw_rounded_rect(self.screen, bar_color, timer_fg_rect, 6)
+            blits.append((self.get_rounded_tile((timer_fg_width, 15), bar_color, 6), timer_bg_rect.topleft))
+        
+        self.blit_batch(self.screen, blits)
         
         # ========== PREGUNTA ==========
         self.draw_question_panel(320)
         
-        # ========== OPCIONES DE RESPUESTA ==========
-        self.draw_answer_options_dual()
-        
-        # ========== ESTADO DE JUGADORES ==========
-        self.draw_player_status()
+        # ========== OPCIONES DE RESPUESTA Y ESTADO DE JUGADORES ==========
+        # Solo cambian con la pregunta o cuando alguien queda bloqueado: se
+        # dibujan una vez sobre el fondo recien limpiado y se guarda esa franja
+        if self._answers_layer is None or self._blocked_mask != self._answers_key:
+            self.draw_answer_options_dual()
+            self.draw_player_status()
+            self._answers_layer = self.screen.subsurface(self._answers_rect).copy()
+            self._answers_key = self._blocked_mask
+        else:
+            self.screen.blit(self._answers_layer, self._answers_rect)
     
     def draw_result_phase(self):
         """
@@ -1416,68 +2067,43 @@ class RobotRaceGame:
             result_text = "NADIE ACERTO"
             result_color = COLORS['error']
         
-        result_rect = pygame.Rect(SCREEN_WIDTH // 2 - 280, 240, 560, 80)
+        result_rect = self._result_rect
         self.draw_rounded_rect(self.screen, result_color, result_rect, 15, 4, COLORS['text_white'])
         
-        result_label = self.font_large.render(result_text, True, COLORS['text_white'])
-        result_label_rect = result_label.get_rect(center=result_rect.center)
-        self.screen.blit(result_label, result_label_rect)
+        self.blit_centered(self.font_large, result_text, COLORS['text_white'], result_rect.center)
         
         # ========== PREGUNTA CON RESPUESTA CORRECTA ==========
         self.draw_question_panel(340)
         
-        if self.current_question:
-            correct_text = self.font_medium.render(
-                f"Respuesta correcta: {self.current_question.respuesta_correcta}", 
-                True, COLORS['success']
-            )
-            correct_rect = correct_text.get_rect(center=(SCREEN_WIDTH // 2, 540))
-            self.screen.blit(correct_text, correct_rect)
+        if self._q_correct:
+            self.screen.blit(*self._q_correct)
         
         # ========== ROBOT CELEBRANDO ==========
         if self.round_winner is not None:
             winner_color = COLORS['player1'] if self.round_winner == 1 else COLORS['player2']
-            robot_x = SCREEN_WIDTH // 2
+            robot_x = SCREEN_CENTER_X
             robot_y = 620
-            bounce = abs(math.sin(self.animation_time * 0.2)) * 15
+            bounce = self.anim_bounce
             self.draw_robot(robot_x, int(robot_y - bounce), 50, winner_color, 0)
         
-        next_text = self.font_small.render("Siguiente pregunta en unos segundos...", True, COLORS['text_gray'])
-        next_rect = next_text.get_rect(center=(SCREEN_WIDTH // 2, 680))
-        self.screen.blit(next_text, next_rect)
+        self.blit_centered(self.font_small, "Siguiente pregunta en unos segundos...", COLORS['text_gray'], (SCREEN_CENTER_X, 680))
     
     def draw_question_panel(self, y_pos: int):
         """
         Dibuja el panel con la pregunta actual.
         """
+        blits: BlitList = []
+        
         q_panel_rect = pygame.Rect(60, y_pos, SCREEN_WIDTH - 120, 100)
         self.draw_rounded_rect(self.screen, COLORS['card'], q_panel_rect, 12, 2, COLORS['accent'])
         
-        q_label = self.font_tiny.render("PREGUNTA", True, COLORS['accent'])
-        q_label_rect = q_label.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 20))
-        self.screen.blit(q_label, q_label_rect)
+        blits.append(self._get_text_centered(self.font_tiny, "PREGUNTA", COLORS['accent'], (SCREEN_CENTER_X, y_pos + 20)))
         
-        if self.current_question:
-            question_text = self.current_question.pregunta
-            
-            if len(question_text) > 70:
-                words = question_text.split()
-                mid = len(words) // 2
-                line1 = ' '.join(words[:mid])
-                line2 = ' '.join(words[mid:])
-                
-                q_text1 = self.font_medium.render(line1, True, COLORS['text_white'])
-                q_text2 = self.font_medium.render(line2, True, COLORS['text_white'])
-                
-                q_rect1 = q_text1.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 50))
-                q_rect2 = q_text2.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 75))
-                
-                self.screen.blit(q_text1, q_rect1)
-                self.screen.blit(q_text2, q_rect2)
-            else:
-                q_text = self.font_medium.render(question_text, True, COLORS['text_white'])
-                q_rect = q_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 60))
-                self.screen.blit(q_text, q_rect)
+        for q_text, y_offset in self._q_lines:
+            q_rect = q_text.get_rect(center=(SCREEN_CENTER_X, y_pos + y_offset))
+            blits.append((q_text, q_rect))
+        
+        self.blit_batch(self.screen, blits)
     
     def draw_answer_options_dual(self):
         """
@@ -1486,50 +2112,35 @@ class RobotRaceGame:
         if not self.current_options:
             return
         
-        option_width = 320
-        option_height = 80
-        option_gap = 20
-        total_width = option_width * 3 + option_gap * 2
-        start_x = (SCREEN_WIDTH - total_width) // 2
-        option_y = 440
+        badge_colors = OPTION_COLORS_BLOCKED if self._blocked_mask == self.ALL_BLOCKED_MASK else OPTION_COLORS
         
-        color_names = ["AZUL", "ROJO", "VERDE"]
-        button_colors = [COLORS['question'], COLORS['error'], COLORS['success']]
+        # Colores del bucle resueltos una sola vez
+        card_color = COLORS['card']
+        border_color = COLORS['border']
+        label_color = COLORS['background']
         
-        for i, option in enumerate(self.current_options):
-            opt_x = start_x + i * (option_width + option_gap)
-            opt_rect = pygame.Rect(opt_x, option_y, option_width, option_height)
-            
-            self.draw_rounded_rect(self.screen, COLORS['card'], opt_rect, 12, 2, COLORS['border'])
-            
-            opt_text_str = str(option)[:25] + "..." if len(str(option)) > 25 else str(option)
-            opt_text = self.font_medium.render(opt_text_str, True, COLORS['text_white'])
-            opt_text_rect = opt_text.get_rect(centerx=opt_rect.centerx, top=opt_rect.y + 12)
-            self.screen.blit(opt_text, opt_text_rect)
-            
-            badge_rect = pygame.Rect(0, 0, 140, 24)
-            badge_rect.centerx = opt_rect.centerx
-            badge_rect.bottom = opt_rect.bottom - 10
-            
-            if self.player1.blocked_this_round and self.player2.blocked_this_round:
-                current_badge_color = COLORS['track_segment']
-            else:
-                current_badge_color = button_colors[i]
-                
-            self.draw_rounded_rect(self.screen, current_badge_color, badge_rect, 6)
+        # Tarjetas, textos y etiquetas en orden de pintado, despachados en un solo lote
+        blits: BlitList = []
+        
+        for i, opt_blit in enumerate(self._option_texts):
+            opt_rect = self._option_rects[i]
+            blits.append((self.get_rounded_tile(opt_rect.size, card_color, 12, 2, border_color), opt_rect))
+            blits.append(opt_blit)
             
-            color_label = self.font_tiny.render(f"BOTON {color_names[i]}", True, COLORS['background'])
-            color_label_rect = color_label.get_rect(center=badge_rect.center)
-            self.screen.blit(color_label, color_label_rect)
+            badge_rect = self._badge_rects[i]
+            blits.append((self.get_rounded_tile(badge_rect.size, badge_colors[i], 6), badge_rect))
+            blits.append(self._get_text_centered(self.font_tiny, OPTION_LABELS[i], label_color, badge_rect.center))
+        
+        self.blit_batch(self.screen, blits)
 
     def draw_player_status(self):
         """
         Dibuja el estado actual de cada jugador con indicador de robot EV3.
         """
-        status_y = 530
+        text_color = COLORS['text_white']
         
         # ========== JUGADOR 1 ==========
-        p1_rect = pygame.Rect(100, status_y, 250, 40)
+        p1_rect = self._status_rect_1
         if self.player1.blocked_this_round:
             p1_color = COLORS['error']
             p1_text = "J1 Robot1: BLOQUEADO"
@@ -1537,13 +2148,11 @@ class RobotRaceGame:
             p1_color = COLORS['player1']
             p1_text = "J1 Robot1: Puede responder"
         
-        self.draw_rounded_rect(self.screen, p1_color, p1_rect, 10, 2, COLORS['text_white'])
-        p1_label = self.font_small.render(p1_text, True, COLORS['text_white'])
-        p1_label_rect = p1_label.get_rect(center=p1_rect.center)
-        self.screen.blit(p1_label, p1_label_rect)
+        self.draw_rounded_rect(self.screen, p1_color, p1_rect, 10, 2, text_color)
+        self.blit_centered(self.font_small, p1_text, text_color, p1_rect.center)
         
         # ========== JUGADOR 2 ==========
-        p2_rect = pygame.Rect(SCREEN_WIDTH - 350, status_y, 250, 40)
+        p2_rect = self._status_rect_2
         if self.player2.blocked_this_round:
             p2_color = COLORS['error']
             p2_text = "J2 Robot2: BLOQUEADO"
@@ -1551,92 +2160,119 @@ class RobotRaceGame:
             p2_color = COLORS['player2']
             p2_text = "J2 Robot2: Puede responder"
         
-        self.draw_rounded_rect(self.screen, p2_color, p2_rect, 10, 2, COLORS['text_white'])
-        p2_label = self.font_small.render(p2_text, True, COLORS['text_white'])
-        p2_label_rect = p2_label.get_rect(center=p2_rect.center)
-        self.screen.blit(p2_label, p2_label_rect)
+        self.draw_rounded_rect(self.screen, p2_color, p2_rect, 10, 2, text_color)
+        self.blit_centered(self.font_small, p2_text, text_color, p2_rect.center)
     
     # ==========================================================================
     #                     PANTALLA DE FIN DE JUEGO
     # ==========================================================================
     
-    def draw_game_over(self):
+    def build_game_over_panel(self) -> pygame.Surface:
         """
-        Dibuja la pantalla de fin de juego con resultados.
+        Compone el panel central de fin de juego (titulo, estadisticas,
+        puntuaciones e instrucciones) sobre una superficie del tamano del panel.
         """
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(COLORS['background'])
-        overlay.set_alpha(230)
-        self.screen.blit(overlay, (0, 0))
-        
-        panel_rect = pygame.Rect(SCREEN_WIDTH // 2 - 250, SCREEN_HEIGHT // 2 - 200, 500, 400)
-        self.draw_rounded_rect(self.screen, COLORS['card'], panel_rect, 20, 3, COLORS['accent'])
+        surface = pygame.Surface((500, 400), pygame.SRCALPHA).convert_alpha()
+        panel_rect = surface.get_rect()
+        center_x, center_y = panel_rect.centerx, panel_rect.centery
         
-        if self.winner == 0:
-            winner_text = "EMPATE!"
-            winner_color = COLORS['accent']
-        elif self.winner == 1:
-            winner_text = "JUGADOR 1 GANA! (Robot 1)"
-            winner_color = COLORS['player1']
-        else:
-            winner_text = "JUGADOR 2 GANA! (Robot 2)"
-            winner_color = COLORS['player2']
+        self.draw_rounded_rect(surface, COLORS['card'], panel_rect, 20, 3, COLORS['accent'])
         
-        title = self.font_large.render(winner_text, True, winner_color)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 120))
-        self.screen.blit(title, title_rect)
-        
-        # ========== ROBOT GANADOR (con 2 ruedas) ==========
-        if self.winner != 0:
-            self.draw_robot(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50, 60, winner_color, 
-                           int(math.sin(self.animation_time * 0.1) * 5))
+        winner_text, winner_color = self.game_over_title()
+        title = self._get_text(self.font_large, winner_text, winner_color)
+        title_rect = title.get_rect(center=(center_x, center_y - 120))
+        surface.blit(title, title_rect)
         
         # ========== ESTADISTICAS ==========
-        stats_text = self.font_small.render(f"Preguntas respondidas: {self.questions_answered}", True, COLORS['text_white'])
-        stats_rect = stats_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-        self.screen.blit(stats_text, stats_rect)
+        stats_text = self._get_text(self.font_small, f"Preguntas respondidas: {self.questions_answered}", COLORS['text_white'])
+        stats_rect = stats_text.get_rect(center=(center_x, center_y + 20))
+        surface.blit(stats_text, stats_rect)
         
         # Info de motores usados
-        total_motors = (2 if ROBOT1_CONNECTED else 0) + (2 if ROBOT2_CONNECTED else 0)
-        motors_info = self.font_tiny.render(
-            f"Motores EV3 activos: {total_motors}/4 | 2 robots Bluetooth", 
-            True, COLORS['bluetooth']
+        motors_info = self._get_text(
+            self.font_tiny,
+            f"Motores EV3 activos: {self.ev3_status['total_motors']}/4 | 2 robots Bluetooth", 
+            COLORS['bluetooth']
         )
-        motors_rect = motors_info.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 42))
-        self.screen.blit(motors_info, motors_rect)
+        motors_rect = motors_info.get_rect(center=(center_x, center_y + 42))
+        surface.blit(motors_info, motors_rect)
         
         # ========== PANELES DE PUNTUACION ==========
-        score_rect_1 = pygame.Rect(panel_rect.x + 30, SCREEN_HEIGHT // 2 + 55, 200, 80)
-        score_rect_2 = pygame.Rect(panel_rect.right - 230, SCREEN_HEIGHT // 2 + 55, 200, 80)
+        score_rect_1 = pygame.Rect(panel_rect.x + 30, center_y + 55, 200, 80)
+        score_rect_2 = pygame.Rect(panel_rect.right - 230, center_y + 55, 200, 80)
         
         # Panel Jugador 1
         p1_bg = COLORS['player1'] if self.winner == 1 else COLORS['card_hover']
-        self.draw_rounded_rect(self.screen, p1_bg, score_rect_1, 12, 2, COLORS['player1'])
+        self.draw_rounded_rect(surface, p1_bg, score_rect_1, 12, 2, COLORS['player1'])
         
-        p1_label = self.font_small.render("Jugador 1 (Robot 1)", True, COLORS['text_gray'])
+        p1_label = self._get_text(self.font_small, "Jugador 1 (Robot 1)", COLORS['text_gray'])
         p1_label_rect = p1_label.get_rect(centerx=score_rect_1.centerx, top=score_rect_1.y + 8)
-        self.screen.blit(p1_label, p1_label_rect)
+        surface.blit(p1_label, p1_label_rect)
         
-        p1_score = self.font_title.render(str(self.player1.score), True, COLORS['player1'])
+        p1_score = self._get_text(self.font_title, str(self.player1.score), COLORS['player1'])
         p1_score_rect = p1_score.get_rect(center=(score_rect_1.centerx, score_rect_1.centery + 18))
-        self.screen.blit(p1_score, p1_score_rect)
+        surface.blit(p1_score, p1_score_rect)
         
         # Panel Jugador 2
         p2_bg = COLORS['player2'] if self.winner == 2 else COLORS['card_hover']
-        self.draw_rounded_rect(self.screen, p2_bg, score_rect_2, 12, 2, COLORS['player2'])
+        self.draw_rounded_rect(surface, p2_bg, score_rect_2, 12, 2, COLORS['player2'])
         
-        p2_label = self.font_small.render("Jugador 2 (Robot 2)", True, COLORS['text_white'])
+        p2_label = self._get_text(self.font_small, "Jugador 2 (Robot 2)", COLORS['text_white'])
         p2_label_rect = p2_label.get_rect(centerx=score_rect_2.centerx, top=score_rect_2.y + 8)
-        self.screen.blit(p2_label, p2_label_rect)
+        surface.blit(p2_label, p2_label_rect)
         
-        p2_score = self.font_title.render(str(self.player2.score), True, COLORS['player2'])
+        p2_score = self._get_text(self.font_title, str(self.player2.score), COLORS['player2'])
         p2_score_rect = p2_score.get_rect(center=(score_rect_2.centerx, score_rect_2.centery + 18))
-        self.screen.blit(p2_score, p2_score_rect)
+        surface.blit(p2_score, p2_score_rect)
         
         # ========== INSTRUCCIONES ==========
-        restart_text = self.font_medium.render("Presiona ESPACIO para jugar de nuevo", True, COLORS['text_gray'])
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 160))
-        self.screen.blit(restart_text, restart_rect)
+        restart_text = self._get_text(self.font_medium, "Presiona ESPACIO para jugar de nuevo", COLORS['text_gray'])
+        restart_rect = restart_text.get_rect(center=(center_x, center_y + 160))
+        surface.blit(restart_text, restart_rect)
+        
+        return surface
+    
+    def game_over_title(self) -> Tuple[str, Color]:
+        """
+        Retorna el texto y el color del resultado final.
+        """
+        if self.winner == 0:
+            return "EMPATE!", COLORS['accent']
+        elif self.winner == 1:
+            return "JUGADOR 1 GANA! (Robot 1)", COLORS['player1']
+        else:
+            return "JUGADOR 2 GANA! (Robot 2)", COLORS['player2']
+    
+    def game_over_frame_state(self) -> tuple:
+        """
+        Lo unico que cambia en la pantalla de fin de juego: los robots de la
+        pista (posicion, balanceo y pupilas) y el balanceo del robot ganador.
+        """
+        return (
+            self.player1.position, int(self.player1.animation_offset * 0.5),
+            self.player2.position, int(self.player2.animation_offset * 0.5),
+            int(self.anim_bob * 5), math.floor(self.anim_pupil),
+            self.winner, self.player1.score, self.player2.score,
+        )
+    
+    def draw_game_over(self):
+        """
+        Dibuja la pantalla de fin de juego con resultados.
+        """
+        self.screen.blit(self._game_over_overlay, (0, 0))
+        
+        # El panel solo se recompone si cambia el resultado mostrado
+        panel_key = (self.winner, self.player1.score, self.player2.score, self.questions_answered)
+        if self._game_over_panel is None or panel_key != self._game_over_key:
+            self._game_over_panel = self.build_game_over_panel()
+            self._game_over_key = panel_key
+        self.screen.blit(self._game_over_panel, (SCREEN_CENTER_X - 250, SCREEN_CENTER_Y - 200))
+        
+        # ========== ROBOT GANADOR (con 2 ruedas) ==========
+        if self.winner != 0:
+            _, winner_color = self.game_over_title()
+            self.draw_robot(SCREEN_CENTER_X, SCREEN_CENTER_Y - 50, 60, winner_color, 
+                           int(self.anim_bob * 5))
     
     # ==========================================================================
     #                      FUNCION PRINCIPAL DE DIBUJO
@@ -1647,14 +2283,31 @@ class RobotRaceGame:
         Funcion principal de renderizado.
         """
         if self.phase == GamePhase.MENU:
-            self.draw_menu()
-        elif self.phase == GamePhase.FINISHED:
-            self.draw_game()
-            self.draw_game_over()
+            # Si el menu no cambio, se conserva el frame que ya esta en pantalla
+            if not self.draw_menu():
+                return
         else:
+            self._menu_last_state = None   # Al volver al menu se redibuja completo
+            if self.phase == GamePhase.FINISHED:
+                # Igual que en el menu: si nada visible cambio, no se redibuja
+                state = self.game_over_frame_state()
+                if state == self._game_over_last_state:
+                    return
+                self._game_over_last_state = state
+            else:
+                self._game_over_last_state = None
             self.draw_game()
-        
-        pygame.display.flip()
+            if self.phase == GamePhase.FINISHED:
+                self.draw_game_over()
+        
+        # Solo se envian a pantalla las zonas que cambian dentro de la fase;
+        # el primer frame de cada fase se envia completo
+        dirty_rects = self._phase_dirty_rects.get(self.phase)
+        if dirty_rects is not None and self._presented_phase == self.phase:
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.flip()
+        self._presented_phase = self.phase
     
     # ==========================================================================
     #                       BUCLE PRINCIPAL
@@ -1664,36 +2317,42 @@ class RobotRaceGame:
         """
         Ejecuta el bucle principal del juego.
         """
-        print("\n" + "="*60)
-        print("         ROBOT RACE QUIZ v7.0 - DUAL EV3 BLUETOOTH")
-        print("       2 Robots EV3 | 4 Motores | Conexion Bluetooth")
-        print("="*60)
-        print("\nARQUITECTURA DE HARDWARE:")
-        print("  Robot 1 (Jugador 1): Motor A (izq) + Motor B (der)")
-        print("  Robot 2 (Jugador 2): Motor A (izq) + Motor B (der)")
-        print(f"  Total motores activos: {(2 if ROBOT1_CONNECTED else 0) + (2 if ROBOT2_CONNECTED else 0)}/4")
-        print("\nControles:")
-        print("  INTERLUDIO: Cuenta regresiva 3, 2, 1...")
-        print("  PREGUNTA: J1 (A/S/W) | J2 (D/F/G) - 30 segundos")
-        print("  El primero en responder CORRECTAMENTE gana!")
-        print("  Si respondes MAL quedas bloqueado esa ronda")
-        print("  MENU: A/D=Nivel1, S/F=Nivel2, W/G=Nivel3 | ESC para salir")
-        print("="*60 + "\n")
+        log.info("=" * 60)
+        log.info("         ROBOT RACE QUIZ v7.0 - DUAL EV3 BLUETOOTH")
+        log.info("       2 Robots EV3 | 4 Motores | Conexion Bluetooth")
+        log.info("=" * 60)
+        log.info("ARQUITECTURA DE HARDWARE:")
+        log.info("  Robot 1 (Jugador 1): Motor A (izq) + Motor B (der)")
+        log.info("  Robot 2 (Jugador 2): Motor A (izq) + Motor B (der)")
+        log.info("  Total motores activos: %s/4", self.ev3_status['total_motors'])
+        log.info("Controles:")
+        log.info("  INTERLUDIO: Cuenta regresiva 3, 2, 1...")
+        log.info("  PREGUNTA: J1 (A/S/W) | J2 (D/F/G) - 30 segundos")
+        log.info("  El primero en responder CORRECTAMENTE gana!")
+        log.info("  Si respondes MAL quedas bloqueado esa ronda")
+        log.info("  MENU: A/D=Nivel1, S/F=Nivel2, W/G=Nivel3 | ESC para salir")
+        log.info("=" * 60)
         
         running = True
         while running:
             running = self.handle_events()
             self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            # Con la ventana minimizada no hay nada que mostrar: solo avanza la logica
+            if pygame.display.get_active():
+                self.draw()
+            else:
+                # Al restaurar la ventana se dibuja y se envia el frame completo
+                self.invalidate_presented_frame()
+            self.clock.tick(self.frame_rate())
         
-        # Detener todos los robots antes de salir
-        stop_all_robots()
+        # Detener todos los robots antes de salir (en el hilo EV3, sin
+        # competir con un comando que aun se este ejecutando)
+        self.shutdown_robots()
         
         # Limpiar recursos de Pygame
         pygame.quit()
-        print("\n[JUEGO] Robot Race Quiz finalizado. Gracias por jugar!")
-        print("[EV3] Todos los motores detenidos.")
+        log.info("[JUEGO] Robot Race Quiz finalizado. Gracias por jugar!")
+        log.info("[EV3] Todos los motores detenidos.")
 
 
 # ==============================================================================